@@ -13,14 +13,19 @@
 """``elective`` module exports."""
 
 from .cli import CliConfiguration
+from .completion import _bash_completion, _fish_completion, _zsh_completion
 from .config import Configuration
 from .elective import ElectiveConfig
 from .env import EnvConfiguration
-from .exceptions import ElectiveFileDecodingError
+from .exceptions import ElectiveFileDecodingError, ElectivePathConflictError
 from .files import FileConfiguration
+from .provenance import ProvenanceStore
 from .state import State
+from .stats import LoadStats, ProviderStats
+from .tracing import ChromeTraceSink, LoggingSink, MemorySink, NullTracer, Tracer
 from .util import (
     _bespon_file_loader,
+    _build_tree,
     _convert_dict_to_list,
     _flatten_to_list,
     _format_sh,
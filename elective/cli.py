@@ -10,82 +10,667 @@
 
 """CLI loader."""
 
-import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
 import textwrap
 
 from .config import Configuration
 
+# Configured parsers, keyed by a hash of their description and options.
+_parsers = {}
+
+
+def _parser_key(description, options):
+    """Hash a parser description and options schema."""
+    encoded = json.dumps(
+        [description, options],
+        sort_keys=True,
+        default=repr,
+    ).encode("utf-8")
+
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _flags(kwargs):
+    """Get the option strings of an argument."""
+    flags = []
+
+    if kwargs.get("short", None):
+        flags.append(f"-{kwargs['short']}")
+    if kwargs.get("long", None):
+        flags.append(f"--{kwargs['long']}")
+
+    if not flags:
+        flags.append(f"--{kwargs['name']}")
+
+    return flags
+
+
+def _to_list(s):
+    """Convert a comma separated argument to a list."""
+    return [] if len(s) == 0 else [item.strip() for item in s.split(",")]
+
+
+def _to_path(s):
+    """Convert an argument to a path, expanding ``~`` and variables."""
+    return os.path.expandvars(os.path.expanduser(s))
+
+
+_DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+}
+_DURATION_TERM = r"(\d+(?:\.\d*)?|\.\d+)\s*(ms|[smhdw])?"
+_DURATION = re.compile(rf"\s*(?:{_DURATION_TERM}\s*)+", re.IGNORECASE)
+_DURATION_TERMS = re.compile(_DURATION_TERM, re.IGNORECASE)
+
+
+def _new_parser(description, prog=None):
+    """Get a new ``argparse.ArgumentParser``."""
+    import argparse
+
+    return argparse.ArgumentParser(description=description, prog=prog)
+
+
+@functools.cache
+def _render_message(message, line_length):
+    """Render a display message, rewrapping its paragraphs."""
+    return "\n\n".join(
+        "\n".join(textwrap.wrap(paragraph.strip(), line_length))
+        for paragraph in textwrap.dedent(message).strip().split("\n\n")
+    )
+
+
+@functools.cache
+def _display_action():
+    """Get the argparse display action class."""
+    import argparse
+
+    class _DisplayAction(argparse.Action):
+        """Custom display action for argparse."""
+
+        def __init__(self, option_strings, dest, message="", line_length=72, **kwargs):
+            """Initialize display action."""
+            super().__init__(option_strings, dest, **kwargs)
+            self.message = message
+            self.line_length = line_length
+
+        def __call__(self, parser, namespace, values, optionString=None):
+            """Call the display action."""
+            print(_render_message(self.message, self.line_length))
+
+            parser.exit(status=0)
+
+    return _DisplayAction
+
+
+@functools.cache
+def _type_error_class():
+    """Get the converter error class.
+
+    The class is an ``argparse.ArgumentTypeError``, so argparse
+    reports its message, and a ``ValueError``, so other loaders using
+    the converters can catch it without argparse.
+    """
+    import argparse
+
+    class _ElectiveTypeError(argparse.ArgumentTypeError, ValueError):
+        """Invalid option value."""
+
+    return _ElectiveTypeError
+
+
+def _type_error(message):
+    """Get an ``argparse.ArgumentTypeError`` that is a ``ValueError``."""
+    return _type_error_class()(message)
+
+
+def _to_duration(s):
+    """Convert a duration argument, like ``1h30m``, to seconds."""
+    if not _DURATION.fullmatch(s):
+        raise _type_error(f"invalid duration: {s!r}")
+
+    return float(
+        sum(
+            float(number) * _DURATION_UNITS[(unit or "s").lower()]
+            for (number, unit) in _DURATION_TERMS.findall(s)
+        )
+    )
+
+
+_BYTES = re.compile(
+    r"\s*(\d+(?:\.\d*)?|\.\d+)\s*(?:([kmgtpe])(i?)(b?)|b)?\s*",
+    re.IGNORECASE,
+)
+_BYTES_POWERS = "kmgtpe"
+
+
+def _to_bytes(s):
+    """Convert a byte size argument, like ``10MiB``, to bytes.
+
+    Single letter suffixes (``K``, ``M``, ...) and IEC suffixes
+    (``KiB``, ``MiB``, ...) are powers of 1024; SI suffixes (``KB``,
+    ``MB``, ...) are powers of 1000.
+    """
+    match = _BYTES.fullmatch(s)
+
+    if not match:
+        raise _type_error(f"invalid byte size: {s!r}")
+
+    (number, prefix, iec, b) = match.groups()
+    scale = 1
+
+    if prefix:
+        base = 1000 if b and not iec else 1024
+        scale = base ** (_BYTES_POWERS.index(prefix.lower()) + 1)
+
+    return round(float(number) * scale)
+
+
+def _to_dict(s):
+    """Convert a comma separated ``key=value`` argument to a dict."""
+    d = {}
+
+    for item in _to_list(s):
+        (k, sep, v) = item.partition("=")
+
+        if not sep or not k.strip():
+            raise _type_error(f"invalid key=value pair: {item!r}")
+
+        d[k.strip()] = v.strip()
+
+    return d
+
+
+def _to_json(s):
+    """Convert a JSON argument."""
+    try:
+        return json.loads(s)
+    except json.JSONDecodeError as error:
+        raise _type_error(f"invalid JSON: {s!r}") from error
+
+
+def _display_registrar(cli, name, dest, option):
+    """Register a display option."""
+    cli._register_display_action(
+        name=name,
+        dest=dest,
+        default=option.get("default", None),
+        help=option.get("help", None),
+    )
+
+
+def _boolean_group_registrar(cli, name, dest, option):
+    """Register a boolean group option."""
+    cli._register_boolean_group(
+        dest=dest,
+        help=option.get("help", None),
+        short_pos=option.get("short_pos", None),
+        short_neg=option.get("short_neg", None),
+        long_pos=option.get("long_pos", None),
+        long_neg=option.get("long_neg", None),
+    )
+
+
+def _boolean_registrar(cli, name, dest, option):
+    """Register a boolean option."""
+    cli._register_boolean(
+        action=option.get("action", "store_true"),
+        default=option.get("default", None),
+        dest=dest,
+        help=option.get("help", None),
+        long=option.get("long", None),
+        name=name,
+        short=option.get("short", None),
+    )
+
+
+def _value_registrar(converter, **extra):
+    """Compile a registrar for a value option type."""
+
+    def registrar(cli, name, dest, option):
+        """Register a value option."""
+        cli._register_value(
+            choices=option.get("choices", None),
+            default=option.get("default", None),
+            dest=dest,
+            extra=extra,
+            help=option.get("help", None),
+            long=option.get("long", None),
+            name=name,
+            short=option.get("short", None),
+            type=converter,
+        )
+
+    return registrar
+
+
+# Argument converters of value option types, keyed by option type and
+# shared with the environment loader.
+_value_converters = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "list": _to_list,
+    "path": _to_path,
+    "duration": _to_duration,
+    "bytes": _to_bytes,
+    "choices": str,
+    "enum": str,
+    "dict": _to_dict,
+    "json": _to_json,
+}
+
+# Option type registrars, keyed by option type.
+_option_types = {
+    "display": _display_registrar,
+    "boolean_group": _boolean_group_registrar,
+    "boolean": _boolean_registrar,
+    "int": _value_registrar(int),
+    "float": _value_registrar(float),
+    "str": _value_registrar(str),
+    "list": _value_registrar(_to_list),
+    "path": _value_registrar(_to_path, metavar="PATH"),
+    "duration": _value_registrar(_to_duration, metavar="DURATION"),
+    "bytes": _value_registrar(_to_bytes, metavar="SIZE"),
+    "choices": _value_registrar(str),
+    "enum": _value_registrar(str),
+    "dict": _value_registrar(_to_dict, metavar="KEY=VALUE,..."),
+    "json": _value_registrar(_to_json, metavar="JSON"),
+}
+
+
+# Parsed argument keys of the subcommand and its unparsed arguments.
+_COMMAND = "command"
+_COMMAND_ARGV = "_command_argv"
+
+# Converters of the option types handled by the fast path parser.
+_fast_types = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "list": _to_list,
+}
+
+
+def _default_dest(flags):
+    """Get the ``dest`` argparse derives from option strings."""
+    for flag in flags:
+        if flag.startswith("--"):
+            return flag[2:].replace("-", "_")
+
+    return flags[0].lstrip("-").replace("-", "_")
+
+
+def _compile_fast_display(compiled, name, dest, option):
+    """Compile a display option for the fast path parser."""
+    flag = f"--{name.lower()}"
+    compiled["fallbacks"].add(flag)
+    compiled["defaults"][_default_dest([flag]) if dest is None else dest] = None
+
+    return True
+
+
+def _compile_fast_boolean_group(compiled, name, dest, option):
+    """Compile a boolean group option for the fast path parser."""
+    flags = [
+        option.get(key, None)
+        for key in ("short_pos", "long_pos", "short_neg", "long_neg")
+    ]
+
+    if dest is None or not all(flags):
+        return False
+
+    consts = compiled["consts"]
+    consts[f"-{flags[0]}"] = consts[f"--{flags[1]}"] = (dest, name, True)
+    consts[f"-{flags[2]}"] = consts[f"--{flags[3]}"] = (dest, name, False)
+    compiled["defaults"][dest] = None
+
+    return True
+
+
+def _compile_fast_boolean(compiled, name, dest, option):
+    """Compile a boolean option for the fast path parser."""
+    action = option.get("action", "store_true")
+
+    if action not in ("store_true", "store_false"):
+        return False
+
+    flags = _flags({**option, "name": name})
+    dest = _default_dest(flags) if dest is None else dest
+
+    for flag in flags:
+        compiled["consts"][flag] = (dest, None, action == "store_true")
+    compiled["defaults"][dest] = option.get("default", None)
+
+    return True
+
+
+def _compile_fast_value(compiled, name, dest, option):
+    """Compile a value option for the fast path parser."""
+    if option.get("choices", None) is not None:
+        return False
+
+    flags = _flags({**option, "name": name})
+    dest = _default_dest(flags) if dest is None else dest
+    converter = _fast_types[option["type"]]
+    default = option.get("default", None)
+
+    # Like argparse, convert string defaults.
+    if isinstance(default, str):
+        try:
+            default = converter(default)
+        except (TypeError, ValueError):
+            return False
+
+    for flag in flags:
+        compiled["values"][flag] = (dest, converter)
+    compiled["defaults"][dest] = default
+
+    return True
+
+
+# Fast path compilers for option types other than values.
+_fast_compilers = {
+    "display": _compile_fast_display,
+    "boolean_group": _compile_fast_boolean_group,
+    "boolean": _compile_fast_boolean,
+}
+
+
+def _compile_fast(schema, commands=(), sparse=False):
+    """Compile an options schema for the fast path parser.
+
+    Parameters
+    ----------
+    schema : dict
+        Options schema, as in ``CliConfiguration.schema``.
+    commands : iterable, default=()
+        Subcommand names.
+    sparse : bool, default=False
+        Omit the defaults of arguments that are not supplied.
+
+    Returns
+    -------
+    dict
+        The compiled ``consts`` (flags storing constants), ``values``
+        (flags storing converted arguments), ``fallbacks`` (flags
+        requiring argparse), ``commands``, and ``defaults``, or
+        ``None`` if the schema has options the fast path parser
+        cannot handle.
+
+    """
+    compiled = {
+        "consts": {},
+        "values": {},
+        "fallbacks": {"-h", "--help"},
+        "commands": frozenset(commands),
+        "defaults": {},
+    }
+
+    if commands:
+        compiled["defaults"][_COMMAND] = None
+        compiled["defaults"][_COMMAND_ARGV] = []
+
+    for name, option in schema.items():
+        if "cli" not in (option.get("providers", None) or ()):
+            continue
+
+        kind = option.get("type", None)
+
+        if kind in _fast_types:
+            compiler = _compile_fast_value
+        elif kind in _option_types:
+            compiler = _fast_compilers.get(kind, None)
+        else:
+            continue
+
+        if compiler is None or not compiler(
+            compiled, name, option.get("dest", name), option
+        ):
+            return None
+
+    if sparse:
+        compiled["defaults"] = {}
+
+    return compiled
+
+
+def _fast_split(values, argv, i):
+    """Split the value flag before ``argv[i]`` from its value.
+
+    Returns
+    -------
+    tuple
+        The flag, its value, and the index of the next argument, or
+        ``None`` if the argument is not a simple value flag.
+
+    """
+    arg = argv[i - 1]
+
+    if arg in values:
+        if i == len(argv) or argv[i].startswith("-"):
+            return None
+
+        return (arg, argv[i], i + 1)
+
+    if arg.startswith("--"):
+        (flag, sep, value) = arg.partition("=")
+
+        if sep and flag in values:
+            return (flag, value, i)
+
+    elif arg[:2] in values:
+        # Like argparse, ``-s=value`` sets ``value``.
+        value = arg[3:] if arg[2:3] == "=" else arg[2:]
+
+        return (arg[:2], value, i)
+
+    return None
+
+
+def _fast_parse(compiled, argv):
+    """Parse simple arguments without argparse.
+
+    Parameters
+    ----------
+    compiled : dict
+        Options compiled by ``_compile_fast()``.
+    argv : list
+        Arguments to parse.
+
+    Returns
+    -------
+    dict
+        The parsed arguments, or ``None`` if argparse must parse
+        ``argv`` for help, display actions, abbreviations, or errors.
+        Arguments following a subcommand are left unparsed.
+
+    """
+    consts = compiled["consts"]
+    values = compiled["values"]
+    fallbacks = compiled["fallbacks"]
+    parsed = dict(compiled["defaults"])
+    groups = {}
+    i = 0
+
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg in compiled["commands"]:
+            parsed[_COMMAND] = arg
+            parsed[_COMMAND_ARGV] = argv[i:]
+            return parsed
+
+        if arg in fallbacks or not arg.startswith("-") or arg in ("-", "--"):
+            return None
+
+        if arg in consts:
+            (dest, group, const) = consts[arg]
+
+            # Mutually exclusive flags.
+            if group is not None and groups.setdefault(group, const) != const:
+                return None
+
+            parsed[dest] = const
+            continue
+
+        split = _fast_split(values, argv, i)
+
+        if split is None:
+            return None
+
+        (arg, value, i) = split
+        (dest, converter) = values[arg]
+
+        try:
+            parsed[dest] = converter(value)
+        except (TypeError, ValueError):
+            return None
+
+    return parsed
+
 
 class CliConfiguration(Configuration):
     """CLI loader for the client program."""
 
     def __init__(self, *args, **kwargs):
         """Initialize a client argument parser."""
+        # Pop our arguments.
+        description = kwargs.pop("description", None)
+        options = kwargs.pop("options")
+        self.commands = kwargs.pop("commands", None) or {}
+        self.prog = kwargs.pop("prog", None)
+        self.cache = kwargs.pop("cache", True)
+        self.fast = kwargs.pop("fast", True)
+        self.sparse = kwargs.pop("sparse", False)
+
         # Call the super.
         super().__init__(*args, **kwargs)
 
-        # Initialize ourself.
-        self.parser = argparse.ArgumentParser()
+        # Initialize ourself.  The parser is built on first use.
+        self.description = description
+        self.schema = options
+        self.options = options
+        self._parser = None
+        self._configured = False
+        self._fast = None
 
-        # Pop our arguments.
-        self.parser.description = kwargs.pop("description", None)
-        self.options = kwargs.pop("options")
+    @property
+    def parser(self):
+        """Get the argument parser, building it if necessary."""
+        if self._parser is None:
+            if self._configured:
+                self._configure_parser()
+            else:
+                self._parser = _new_parser(self.description, self.prog)
+
+        return self._parser
+
+    @parser.setter
+    def parser(self, parser):
+        """Set the argument parser."""
+        self._parser = parser
+
+    @staticmethod
+    def clear_cache():
+        """Clear the configured parser cache."""
+        _parsers.clear()
+
+    @staticmethod
+    def register_type(name, converter=None, registrar=None, **kwargs):
+        """Register an option type.
+
+        Register a value type by its ``converter`` or any other type
+        by its ``registrar``.  Registered types are available to every
+        ``CliConfiguration`` as the ``type`` of an option.  Value type
+        converters also convert environment variables; the variables
+        of other types are loaded as strings.
+
+        Parameters
+        ----------
+        name : str
+            Type name, as used in the ``type`` of an option.
+        converter : function, default=None
+            Function converting an argument string to the option
+            value; raise ``argparse.ArgumentTypeError`` or
+            ``ValueError`` on invalid arguments.
+        registrar : function, default=None
+            Function accepting a ``CliConfiguration``, the option
+            name, the option ``dest``, and the option schema that
+            registers the option in the ``CliConfiguration.parser``.
+        kwargs : dict
+            Additional ``add_argument()`` arguments for value types.
+
+        Raises
+        ------
+        ValueError
+            Raises unless exactly one of ``converter`` and
+            ``registrar`` is supplied.
+
+        """
+        if (converter is None) == (registrar is None):
+            raise ValueError("register a type with a converter or a registrar")
+
+        if registrar is None:
+            registrar = _value_registrar(converter, **kwargs)
+            _value_converters[name] = converter
+        else:
+            _value_converters.pop(name, None)
+
+        _option_types[name] = registrar
+        _fast_types.pop(name, None)
+        _fast_compilers.pop(name, None)
+
+        # Cached parsers may use a previous registration.
+        _parsers.clear()
+
+    def _default(self, default):
+        """Get the parser default of an argument.
+
+        Sparse parsers suppress all defaults, so that only supplied
+        arguments are parsed.
+        """
+        if self.sparse:
+            import argparse
+
+            return argparse.SUPPRESS
+
+        return default
 
     def _register_boolean(self, **kwargs):
         """Register a boolean argument in the parser."""
         self.parser.add_argument(
-            f"-{kwargs.get('short', None)}",
-            f"--{kwargs.get('long', None)}",
+            *_flags(kwargs),
             dest=kwargs.get("dest", None),
-            default=kwargs.get("default", None),
+            default=self._default(kwargs.get("default", None)),
             action=kwargs.get("action", None),
             help=kwargs.get("help", None),
         )
 
-    def _register_int(self, **kwargs):
-        """Register an integer argument in the parser."""
-        self.parser.add_argument(
-            f"-{kwargs.get('short', None)}",
-            f"--{kwargs.get('long', None)}",
-            dest=kwargs.get("dest", None),
-            default=kwargs.get("default", None),
-            help=kwargs.get("help", None),
-            type=int,
-        )
-
-    def _register_float(self, **kwargs):
-        """Register a float argument in the parser."""
-        self.parser.add_argument(
-            f"-{kwargs.get('short', None)}",
-            f"--{kwargs.get('long', None)}",
-            dest=kwargs.get("dest", None),
-            default=kwargs.get("default", None),
-            help=kwargs.get("help", None),
-            type=float,
-        )
+    def _register_value(self, **kwargs):
+        """Register a value argument in the parser."""
+        extra = kwargs.get("extra", {})
 
-    def _register_str(self, **kwargs):
-        """Register a string argument in the parser."""
-        self.parser.add_argument(
-            f"-{kwargs.get('short', None)}",
-            f"--{kwargs.get('long', None)}",
-            dest=kwargs.get("dest", None),
-            default=kwargs.get("default", None),
-            help=kwargs.get("help", None),
-            type=str,
-        )
+        if kwargs.get("choices", None) is not None:
+            extra = {**extra, "choices": kwargs["choices"]}
 
-    def _register_list(self, **kwargs):
-        """Register a list argument in the parser."""
         self.parser.add_argument(
-            f"-{kwargs.get('short', None)}",
-            f"--{kwargs.get('long', None)}",
+            *_flags(kwargs),
             dest=kwargs.get("dest", None),
-            default=kwargs.get("default", None),
+            default=self._default(kwargs.get("default", None)),
             help=kwargs.get("help", None),
-            type=lambda s: []
-            if len(s) == 0
-            else [item.strip() for item in s.split(",")],
+            type=kwargs.get("type", None),
+            **extra,
         )
 
     def _register_boolean_group(self, **kwargs):
@@ -102,7 +687,7 @@ class CliConfiguration(Configuration):
             short_pos,
             long_pos,
             dest=dest,
-            default=None,
+            default=self._default(None),
             action="store_true",
             help=help,
         )
@@ -110,134 +695,183 @@ class CliConfiguration(Configuration):
             short_neg,
             long_neg,
             dest=dest,
-            default=None,
+            default=self._default(None),
             action="store_false",
             help=help,
         )
 
     def _register_display_action(self, line_length=72, **kwargs):
-        """Register a display action."""
+        """Register a display action.
+
+        The message is rendered only when the action is called.
+        """
         name = kwargs.get("name", None)
         dest = kwargs.get("dest", None)
         default = kwargs.get("default", None)
         help = kwargs.get("help", None)
 
-        rendered_message = "\n\n".join(
-            list(
-                map(
-                    lambda item: "\n".join(
-                        textwrap.wrap(
-                            item.strip(),
-                            line_length,
-                        ),
-                    ),
-                    textwrap.dedent(default).strip().split("\n\n"),
-                )
-            )
-        )
-
-        class _DisplayAction(argparse.Action):
-            """Custom display action for argparse."""
-
-            def __init__(self, option_strings, dest, **kwargs):
-                """Initialize display action."""
-                super().__init__(option_strings, dest, **kwargs)
-
-            def __call__(self, parser, namespace, values, optionString=None):
-                """Call the display action."""
-                print(rendered_message)
-
-                parser.exit(status=0),
-
         self.parser.add_argument(
             f"--{name.lower()}",
             nargs=0,
-            action=_DisplayAction,
+            action=_display_action(),
             help=help,
             dest=dest,
+            default=self._default(None),
+            message=default,
+            line_length=line_length,
         )
 
     def config(self):
-        """Configure a client argument parser."""
+        """Configure a client argument parser.
+
+        Options are compiled for the fast path parser, which parses
+        simple arguments without argparse, unless ``fast`` is false
+        or the options include types it cannot handle.  The argparse
+        parser is configured only when needed.
+
+        Configured parsers are cached by description and options
+        schema, and reused by later configurations with the same
+        schema unless ``cache`` is false.  Cached parsers are shared;
+        reset the parser before modifying it.
+        """
+        self._configured = True
+        self._fast = None
+
+        if self.fast:
+            self._fast = _compile_fast(self.schema, self.commands, self.sparse)
+
+        if self._fast is None:
+            self._configure_parser()
+
+    def _configure_parser(self):
+        """Configure the argparse parser."""
+        if self.cache:
+            key = _parser_key(
+                [self.description, self.prog, self.sparse],
+                [self.schema, self._command_helps()],
+            )
+            cached = _parsers.get(key, None)
+
+            if cached is not None:
+                self.parser = cached
+                return
+
+        self.parser = _new_parser(self.description, self.prog)
+
         # Add any options to the parser.
-        for (k, v) in self.options.items():
-            if "cli" in v["providers"]:
-                dest = k
-                # Optionally set ``dest``.
-                try:
-                    dest = v["dest"]
-                except (KeyError):
-                    pass
-
-                if v["type"] == "display":
-                    self._register_display_action(
-                        name=k,
-                        dest=dest,
-                        default=v["default"],
-                        help=v["help"],
-                    )
-                elif v["type"] == "boolean_group":
-                    self._register_boolean_group(
-                        dest=dest,
-                        help=v["help"],
-                        short_pos=v["short_pos"],
-                        short_neg=v["short_neg"],
-                        long_pos=v["long_pos"],
-                        long_neg=v["long_neg"],
-                    )
-                elif v["type"] == "boolean":
-                    self._register_boolean(
-                        action=v["action"],
-                        default=v["default"],
-                        dest=dest,
-                        help=v["help"],
-                        long=v["long"],
-                        short=v["short"],
-                    )
-                elif v["type"] == "int":
-                    self._register_int(
-                        default=v["default"],
-                        dest=dest,
-                        help=v["help"],
-                        long=v["long"],
-                        short=v["short"],
-                    )
-                elif v["type"] == "float":
-                    self._register_float(
-                        default=v["default"],
-                        dest=dest,
-                        help=v["help"],
-                        long=v["long"],
-                        short=v["short"],
-                    )
-                elif v["type"] == "str":
-                    self._register_str(
-                        default=v["default"],
-                        dest=dest,
-                        help=v["help"],
-                        long=v["long"],
-                        short=v["short"],
-                    )
-                elif v["type"] == "list":
-                    self._register_list(
-                        default=v["default"],
-                        dest=dest,
-                        help=v["help"],
-                        long=v["long"],
-                        short=v["short"],
-                    )
+        for (k, v) in self.schema.items():
+            if "cli" in (v.get("providers", None) or ()):
+                registrar = _option_types.get(v.get("type", None), None)
+
+                if registrar is not None:
+                    registrar(self, k, v.get("dest", k), v)
+
+        if self.commands:
+            self._register_commands()
+
+        if self.cache:
+            _parsers[key] = self.parser
+
+    def _command_helps(self):
+        """Get the help of each subcommand."""
+        return {
+            name: command.get("help", None) for name, command in self.commands.items()
+        }
+
+    def _register_commands(self):
+        """Register the subcommand arguments in the parser.
+
+        Only the subcommand name is registered; its arguments are
+        collected unparsed for the subcommand's own parser.
+        """
+        import argparse
+
+        helps = self._command_helps()
+        self.parser.add_argument(
+            _COMMAND,
+            nargs="?",
+            choices=list(helps),
+            metavar="command",
+            help="; ".join(f"{name}: {help}" for name, help in helps.items()),
+        )
+        self.parser.add_argument(
+            _COMMAND_ARGV,
+            nargs=argparse.REMAINDER,
+            help=argparse.SUPPRESS,
+        )
+
+    def _load_command(self, parsed):
+        """Load the arguments of the selected subcommand.
+
+        The subcommand's parser is configured only when it is
+        selected, and its arguments are stored in a dict under the
+        subcommand name.
+        """
+        argv = parsed.pop(_COMMAND_ARGV, None) or []
+        name = parsed.get(_COMMAND, None)
+
+        if name is None:
+            # argparse checks suppressed defaults of optional
+            # positionals against their choices, so drop it here.
+            if self.sparse:
+                parsed.pop(_COMMAND, None)
+
+            return parsed
+
+        command = self.commands[name]
+        prog = self.prog or os.path.basename(sys.argv[0])
+
+        sub = CliConfiguration(
+            description=command.get("help", None),
+            options=command.get("options", None) or {},
+            commands=command.get("commands", None),
+            prog=f"{prog} {name}",
+            cache=self.cache,
+            fast=self.fast,
+            sparse=self.sparse,
+        )
+        sub.config()
+        sub.load(argv=argv)
+
+        parsed[name] = sub.options
+
+        return parsed
 
     def reset_parser(self):
         """Reset an argument parser."""
-        self.parser = argparse.ArgumentParser()
+        self.description = None
+        self._configured = False
+        self._fast = None
+        self.parser = _new_parser(None)
 
     def load(self, *args, **kwargs):
-        """Load CLI arguments."""
+        """Load CLI arguments.
+
+        Simple arguments are parsed by the fast path parser; help,
+        display actions, and anything it cannot parse, including
+        errors, fall back to argparse.
+
+        With subcommands, the selected subcommand is stored under
+        ``command`` and its arguments under the subcommand name.
+
+        If ``sparse`` is true, only supplied arguments are loaded.
+        """
         # Pop our arguments.
         argv = kwargs.pop("argv", None)
 
-        # Convert the argparse `Namespace()` object to a dict.
-        if argv is not None:
-            self.options = vars(self.parser.parse_args(argv))
-        else:
-            self.options = vars(self.parser.parse_args())
+        if argv is None:
+            argv = sys.argv[1:]
+
+        parsed = None
+
+        if self._fast is not None:
+            parsed = _fast_parse(self._fast, argv)
+
+        if parsed is None:
+            # Convert the argparse `Namespace()` object to a dict.
+            parsed = vars(self.parser.parse_args(argv))
+
+        if self.commands:
+            parsed = self._load_command(parsed)
+
+        self.options = parsed
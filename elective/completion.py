@@ -0,0 +1,427 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Shell completion script generation."""
+
+import re
+
+from .cli import _flags
+
+# Option types that do not take a value.
+_FLAG_TYPES = ("display", "boolean", "boolean_group")
+
+
+def _option_specs(options):
+    """Get the completion specs of the command line options.
+
+    Parameters
+    ----------
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+
+    Returns
+    -------
+    list
+        List of dicts with the ``flags`` of each argument, its
+        ``help``, the ``exclusive`` flags it conflicts with, whether
+        it takes a ``value``, its ``choices``, and whether it
+        completes ``files``.
+
+    """
+    specs = [
+        {
+            "flags": ["-h", "--help"],
+            "help": "show this help message and exit",
+            "exclusive": [],
+            "value": False,
+            "choices": None,
+            "files": False,
+        }
+    ]
+
+    for name, option in options.items():
+        if "cli" not in (option.get("providers", None) or ()):
+            continue
+
+        kind = option.get("type", None)
+        help = option.get("help", None) or ""
+
+        if kind == "display":
+            flags = [[f"--{name.lower()}"]]
+        elif kind == "boolean_group":
+            flags = [
+                [f"-{option['short_pos']}", f"--{option['long_pos']}"],
+                [f"-{option['short_neg']}", f"--{option['long_neg']}"],
+            ]
+        else:
+            flags = [_flags({**option, "name": name})]
+
+        exclusive = [flag for group in flags for flag in group]
+
+        for group in flags:
+            specs.append(
+                {
+                    "flags": group,
+                    "help": help,
+                    "exclusive": exclusive,
+                    "value": kind not in _FLAG_TYPES,
+                    "choices": option.get("choices", None),
+                    "files": kind == "path",
+                }
+            )
+
+    return specs
+
+
+def _command_paths(commands, path=()):
+    """Get each subcommand path with its options and subcommands.
+
+    Parameters
+    ----------
+    commands : dict
+        Subcommand schemas, as in ``ElectiveConfig.commands``.
+    path : tuple, default=()
+        Path of the parent subcommand.
+
+    Yields
+    ------
+    tuple
+        The path, options, and subcommands of each subcommand.
+
+    """
+    for name, command in commands.items():
+        sub = (*path, name)
+        children = command.get("commands", None) or {}
+
+        yield (sub, command.get("options", None) or {}, children)
+        yield from _command_paths(children, sub)
+
+
+def _levels(options, commands):
+    """Get the path, option specs, and subcommands of every level."""
+    levels = [((), _option_specs(options), commands)]
+
+    for path, sub_options, children in _command_paths(commands):
+        levels.append((path, _option_specs(sub_options), children))
+
+    return levels
+
+
+def _function_name(prog):
+    """Get a shell function name for a program."""
+    return "_" + "".join(c if c.isalnum() else "_" for c in prog)
+
+
+_BASH_SPECIAL = re.compile(r"([^\w\-./=+,:@%])")
+
+
+def _bash_words(words):
+    """Quote a ``compgen -W`` word list for bash.
+
+    ``compgen`` expands its word list, so backslash escape the shell
+    special characters of each word, then single quote the list.
+    """
+    escaped = " ".join(_BASH_SPECIAL.sub(r"\\\1", word) for word in words)
+
+    return "'" + escaped.replace("'", "'\\''") + "'"
+
+
+def _bash_completion(prog, options, commands=None):
+    """Generate a bash completion script.
+
+    Parameters
+    ----------
+    prog : str
+        Program name.
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+    commands : dict, default=None
+        Subcommand schemas, as in ``ElectiveConfig.commands``.
+
+    Returns
+    -------
+    str
+        A bash script defining and registering the completion.
+
+    """
+    func = _function_name(prog)
+    levels = _levels(options, commands or {})
+    paths = "|".join(f'"/{"/".join(path)}"' for (path, _, _) in levels[1:])
+
+    lines = [
+        f"{func}() {{",
+        '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+        '    local prev="${COMP_WORDS[COMP_CWORD-1]}"',
+        '    local cmdpath="" word i opts',
+        "",
+    ]
+
+    if paths:
+        lines += [
+            "    for ((i = 1; i < COMP_CWORD; i++)); do",
+            '        word="${COMP_WORDS[i]}"',
+            '        case "$cmdpath/$word" in',
+            f'            {paths}) cmdpath="$cmdpath/$word" ;;',
+            "        esac",
+            "    done",
+            "",
+        ]
+
+    lines.append('    case "$cmdpath" in')
+
+    for path, specs, children in levels:
+        lines.append(f'        "{"/" if path else ""}{"/".join(path)}")')
+        lines.append('            case "$prev" in')
+
+        for spec in specs:
+            if not spec["value"]:
+                continue
+
+            if spec["choices"]:
+                # Read the words by line, without splitting or globbing.
+                words = _bash_words(str(choice) for choice in spec["choices"])
+                reply = (
+                    "COMPREPLY=(); while IFS= read -r word;"
+                    ' do COMPREPLY+=("$word"); done'
+                    f' < <(compgen -W {words} -- "$cur")'
+                )
+            elif spec["files"]:
+                reply = 'COMPREPLY=($(compgen -f -- "$cur"))'
+            else:
+                reply = "COMPREPLY=()"
+
+            lines.append(
+                f"                {'|'.join(spec['flags'])}) {reply}; return ;;"
+            )
+
+        words = [flag for spec in specs for flag in spec["flags"]] + list(children)
+
+        lines += [
+            "            esac",
+            f'            opts="{" ".join(words)}" ;;',
+        ]
+
+    lines += [
+        "    esac",
+        "",
+        '    COMPREPLY=($(compgen -W "$opts" -- "$cur"))',
+        "}",
+        "",
+        f"complete -F {func} {prog}",
+        "",
+    ]
+
+    return "\n".join(lines)
+
+
+def _zsh_escape(s):
+    """Escape a string for a zsh ``_arguments`` spec."""
+    for c in "\\[]:":
+        s = s.replace(c, f"\\{c}")
+
+    return s.replace("'", "'\\''")
+
+
+def _zsh_describe(s):
+    """Double quote a subcommand description for zsh."""
+    escaped = _zsh_escape(s).replace('"', '\\"')
+
+    return f'"{escaped}"'
+
+
+def _zsh_spec(spec):
+    """Get the zsh ``_arguments`` spec of an argument."""
+    flags = spec["flags"]
+    exclusive = " ".join(spec["exclusive"])
+    names = f"{{{','.join(flags)}}}" if len(flags) > 1 else flags[0]
+    action = ""
+
+    if spec["value"]:
+        if spec["choices"]:
+            words = " ".join(_zsh_escape(str(choice)) for choice in spec["choices"])
+            action = f":value:({words})"
+        elif spec["files"]:
+            action = ":path:_files"
+        else:
+            action = ":value: "
+
+    excluded = f"'({exclusive})'" if exclusive else ""
+
+    return f"{excluded}{names}'[{_zsh_escape(spec['help'])}]{action}'"
+
+
+def _zsh_completion(prog, options, commands=None):
+    """Generate a zsh completion script.
+
+    Parameters
+    ----------
+    prog : str
+        Program name.
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+    commands : dict, default=None
+        Subcommand schemas, as in ``ElectiveConfig.commands``.
+
+    Returns
+    -------
+    str
+        A zsh script defining and registering the completion.
+
+    """
+    func = _function_name(prog)
+    levels = _levels(options, commands or {})
+    paths = "|".join(f'"/{"/".join(path)}"' for (path, _, _) in levels[1:])
+
+    lines = [
+        f"#compdef {prog}",
+        "",
+        f"{func}() {{",
+        '    local cmdpath="" word i start=1',
+        "",
+    ]
+
+    if paths:
+        lines += [
+            "    for ((i = 2; i < CURRENT; i++)); do",
+            '        word="${words[i]}"',
+            '        case "$cmdpath/$word" in',
+            f'            {paths}) cmdpath="$cmdpath/$word"; start=$i ;;',
+            "        esac",
+            "    done",
+            "",
+            '    words=("${(@)words[start,-1]}")',
+            "    (( CURRENT -= start - 1 ))",
+            "",
+        ]
+
+    lines.append('    case "$cmdpath" in')
+
+    for path, specs, children in levels:
+        args = [_zsh_spec(spec) for spec in specs]
+
+        if children:
+            described = " ".join(
+                f"{name}\\:{_zsh_describe(command.get('help', None) or '')}"
+                for (name, command) in children.items()
+            )
+            args.append(f"'1:command:(({described}))'")
+            args.append("'*:: :->args'")
+
+        lines.append(f'        "{"/" if path else ""}{"/".join(path)}")')
+        lines.append("            _arguments -s \\")
+        lines += [f"                {arg} \\" for arg in args[:-1]]
+        lines.append(f"                {args[-1]}")
+        lines.append("            ;;")
+
+    lines += [
+        "    esac",
+        "}",
+        "",
+        f'{func} "$@"',
+        "",
+    ]
+
+    return "\n".join(lines)
+
+
+def _fish_escape(s):
+    """Quote a string for fish."""
+    return "'" + s.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _fish_spec(prog, condition, spec):
+    """Get the fish ``complete`` command of an argument."""
+    parts = [f"complete -c {prog}"]
+
+    if condition:
+        parts.append(f"-n {_fish_escape(condition)}")
+
+    for flag in spec["flags"]:
+        if flag.startswith("--"):
+            parts.append(f"-l {flag[2:]}")
+        elif len(flag) == 2:
+            parts.append(f"-s {flag[1:]}")
+        else:
+            parts.append(f"-o {flag[1:]}")
+
+    if spec["value"]:
+        if spec["choices"]:
+            words = " ".join(str(choice) for choice in spec["choices"])
+            parts.append(f"-x -a {_fish_escape(words)}")
+        elif spec["files"]:
+            parts.append("-r -F")
+        else:
+            parts.append("-x")
+
+    parts.append(f"-d {_fish_escape(spec['help'])}")
+
+    return " ".join(parts)
+
+
+def _fish_completion(prog, options, commands=None):
+    """Generate a fish completion script.
+
+    Parameters
+    ----------
+    prog : str
+        Program name.
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+    commands : dict, default=None
+        Subcommand schemas, as in ``ElectiveConfig.commands``.
+
+    Returns
+    -------
+    str
+        A fish script registering the completion.
+
+    """
+    levels = _levels(options, commands or {})
+    names = " ".join(name for (path, _, _) in levels[1:] for name in path[-1:])
+    lines = [f"complete -c {prog} -f"]
+
+    for path, specs, children in levels:
+        if path:
+            condition = f"__fish_seen_subcommand_from {path[-1]}"
+        elif names:
+            condition = f"not __fish_seen_subcommand_from {names}"
+        else:
+            condition = None
+
+        if children:
+            child_names = " ".join(children)
+            child_condition = f"not __fish_seen_subcommand_from {child_names}"
+
+            if path:
+                child_condition = f"{condition}; and {child_condition}"
+
+            for name, command in children.items():
+                lines.append(
+                    f"complete -c {prog}"
+                    f" -n {_fish_escape(child_condition)}"
+                    f" -a {name}"
+                    f" -d {_fish_escape(command.get('help', None) or '')}"
+                )
+
+        lines += [_fish_spec(prog, condition, spec) for spec in specs]
+
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# Completion script generators, keyed by shell.
+_completions = {
+    "bash": _bash_completion,
+    "fish": _fish_completion,
+    "zsh": _zsh_completion,
+}
@@ -10,12 +10,248 @@
 
 """elective configuration functions."""
 
+import collections
 import copy
+import functools
+import time
+import types
 
 from .cli import CliConfiguration
-from .exceptions import ElectiveFileLoadingError
+from .completion import _completions
+from .env import EnvConfiguration
 from .files import FileConfiguration
+from .provenance import ProvenanceStore
 from .state import State
+from .stats import LoadStats
+from .tracing import _default_tracer
+
+# Option keys used only by some option types.
+_OPTIONAL_KEYS = (
+    "short",
+    "long",
+    "action",
+    "choices",
+    "merge",
+    "merge_key",
+)
+
+# List merge strategies of options.
+_STRATEGIES = (
+    "append",
+    "replace",
+    "union",
+    "keyed",
+)
+
+# Provenance backends; a ``State`` per leaf or a columnar store.
+_BACKENDS = (
+    "state",
+    "columnar",
+)
+
+# Merge engines; recursive merging of trees or flat path maps.
+_MERGES = (
+    "tree",
+    "flat",
+)
+
+# Flat map marker for non-empty dicts.
+_BRANCH = object()
+
+# File providers, matched by ``file`` in an option's providers.
+_FILE_FORMATS = (
+    "toml",
+    "json",
+    "yaml",
+    "bespon",
+)
+
+
+def _allows(option, provider):
+    """Check that an option may be set by a provider."""
+    providers = option.get("providers", None)
+
+    if providers is None:
+        return True
+
+    return provider in providers or (provider in _FILE_FORMATS and "file" in providers)
+
+
+def _compile_drops(options, order):
+    """Compile the option keys to drop from each provider.
+
+    Parameters
+    ----------
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+    order : list
+        Provider names, as in ``elective["order"]``.
+
+    Returns
+    -------
+    dict
+        Dict of provider names to the frozenset of option keys that
+        the provider may not set.  Defaults may set every option.
+
+    """
+    return {
+        provider: frozenset(
+            k
+            for (k, option) in options.items()
+            if isinstance(option, dict) and not _allows(option, provider)
+        )
+        for provider in order
+        if provider != "defaults"
+    }
+
+
+def _compile_strategies(options):
+    """Compile the list merge strategies of the options.
+
+    Parameters
+    ----------
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+
+    Returns
+    -------
+    dict
+        Dict of option keys to ``(strategy, field)`` pairs, for the
+        options with a ``merge`` strategy.
+
+    Raises
+    ------
+    ValueError
+        Raises when a strategy is unknown or a ``keyed`` strategy
+        has no ``merge_key``.
+
+    """
+    strategies = {}
+
+    for (k, option) in options.items():
+        if not isinstance(option, dict) or option.get("merge", None) is None:
+            continue
+
+        strategy = option["merge"]
+        field = option.get("merge_key", None)
+
+        if strategy not in _STRATEGIES:
+            raise ValueError(
+                f"configured `merge` of option `{k}` ({strategy})"
+                f" is not one of {_STRATEGIES}"
+            )
+
+        if strategy == "keyed" and field is None:
+            raise ValueError(f"keyed `merge` of option `{k}` has no `merge_key`")
+
+        strategies[k] = (strategy, field)
+
+    return strategies
+
+
+# Providers that may be named in ``order``.
+_PROVIDERS = ("defaults", "cli", "env", *_FILE_FORMATS)
+
+
+class _Plan(
+    collections.namedtuple(
+        "_Plan",
+        ("key", "combine", "providers", "sources", "drops", "strategies"),
+    )
+):
+    """Immutable, precompiled provider precedence.
+
+    Attributes
+    ----------
+    key : tuple
+        The ``combine`` mode and ``order`` compiled into the plan.
+    combine : str
+        The ``combine`` mode.
+    providers : tuple
+        Known provider names from ``order``, in merge order, or in
+        precedence order (highest first) if ``combine`` is ``None``.
+    sources : mappingproxy
+        ``State`` source name of each provider.
+    drops : mappingproxy
+        Option keys each provider may not set, as from
+        ``_compile_drops()``.
+    strategies : mappingproxy
+        List merge strategy of each option, as from
+        ``_compile_strategies()``.
+
+    """
+
+    __slots__ = ()
+
+
+def _compile_plan(combine, order, options):
+    """Compile ``combine`` and ``order`` into a precedence plan.
+
+    Parameters
+    ----------
+    combine : str
+        Combine mode, as in ``elective["combine"]``.
+    order : list
+        Provider names, as in ``elective["order"]``.
+    options : dict
+        Options schema, as in ``ElectiveConfig.options``.
+
+    Returns
+    -------
+    _Plan
+        The immutable plan.
+
+    """
+    providers = tuple(name for name in order if name in _PROVIDERS)
+
+    if combine != "left":
+        providers = providers[::-1]
+
+    return _Plan(
+        key=(combine, tuple(order)),
+        combine=combine,
+        providers=providers,
+        sources=types.MappingProxyType(
+            {name: "default" if name == "defaults" else name for name in providers}
+        ),
+        drops=types.MappingProxyType(_compile_drops(options, providers)),
+        strategies=types.MappingProxyType(_compile_strategies(options)),
+    )
+
+
+def _item_key(item, field=None):
+    """Get the hashable key of a stateful list item.
+
+    Returns
+    -------
+    tuple
+        The type and current value of the item, or of its ``field``
+        if ``field`` is set, or ``None`` if the item has no key.
+
+    """
+    if field is not None:
+        item = item.get(field, None) if isinstance(item, dict) else None
+
+    if not isinstance(item, State):
+        return None
+
+    return (type(item.current), item.current)
+
+
+def _same(left, right):
+    """Check that two raw option trees are identical, including types."""
+    if type(left) is not type(right):
+        return False
+
+    if isinstance(left, dict):
+        return list(left) == list(right) and all(
+            _same(v, right[k]) for (k, v) in left.items()
+        )
+
+    if isinstance(left, (list, tuple)):
+        return len(left) == len(right) and all(map(_same, left, right))
+
+    return left == right or (left != left and right != right)
 
 
 class ElectiveConfig:
@@ -27,6 +263,10 @@ class ElectiveConfig:
         self.elective["description"] = ""
         self.elective["prefix"] = ""
         self.elective["combine"] = "left"
+        self.elective["sparse"] = False
+        self.elective["max_history"] = None
+        self.elective["backend"] = "state"
+        self.elective["merge"] = "tree"
         self.elective["order"] = [
             "defaults",
             "toml",
@@ -37,11 +277,242 @@ class ElectiveConfig:
             "cli",
         ]
         self.defaults = {}
+        self._default_values = {}
         self.options = {}
+        self.commands = {}
+        self.provenance = None
+        self.executor = None
+        self.tracer = _default_tracer()
+        self.stats = None
+        self._pending_stats = None
+        self._env = None
+        self._plan = None
+
+        # Raw and stateful options of each provider from the last
+        # load, and the last merged configuration with its order.
+        self._providers = {}
+        self._flats = {}
+        self._merged = (None, None)
         self._configured = False
 
     @staticmethod
-    def _make_stateful(d, source):
+    def _merge_list(left, right, strategy="append", field=None):
+        """Merge list ``right`` into list ``left`` with a strategy.
+
+        Strategies are:
+
+        ``append``
+            Append the ``right`` items, as ``_merge()``.
+        ``replace``
+            Replace the ``left`` items with the ``right`` items.
+        ``union``
+            Append the ``right`` items with values not already in
+            the list.
+        ``keyed``
+            Merge dict items with the same value of ``field`` and
+            append the others.
+
+        An unset (``None``) ``State`` on either side is replaced by
+        the other side, and other values are merged by ``_merge()``.
+
+        Parameters
+        ----------
+        left : list
+            Left list, or ``None`` for no left.
+        right : list
+            Right list.
+        strategy : str, default="append"
+            Merge strategy.
+        field : str, default=None
+            Key field of ``keyed`` items.
+
+        Returns
+        -------
+        list
+            The merged list, sharing items with ``left`` and
+            ``right``.
+
+        """
+        if left is None or (isinstance(left, State) and left.current is None):
+            return right
+
+        if isinstance(right, State) and right.current is None:
+            return left
+
+        if (
+            strategy == "append"
+            or not isinstance(left, list)
+            or not isinstance(right, (list, tuple))
+        ):
+            return ElectiveConfig._merge(left, right)
+
+        if strategy == "replace":
+            return list(right)
+
+        if strategy == "union":
+            return ElectiveConfig._merge_union(left, right)
+
+        return ElectiveConfig._merge_keyed(left, right, field)
+
+    @staticmethod
+    def _merge_union(left, right):
+        """Append the ``right`` items with values not in ``left``."""
+        res = list(left)
+        seen = {_item_key(item) for item in res}
+
+        for item in right:
+            key = _item_key(item)
+
+            if key is None or key not in seen:
+                seen.add(key)
+                res.append(item)
+
+        return res
+
+    @staticmethod
+    def _merge_keyed(left, right, field):
+        """Merge the items of ``right`` into ``left`` by ``field``."""
+        res = list(left)
+        index = {}
+
+        for (i, item) in enumerate(res):
+            index.setdefault(_item_key(item, field), i)
+
+        for item in right:
+            key = _item_key(item, field)
+
+            if key is not None and key in index:
+                res[index[key]] = ElectiveConfig._merge(res[index[key]], item)
+            else:
+                index.setdefault(key, len(res))
+                res.append(item)
+
+        return res
+
+    @staticmethod
+    def _flatten(tree, path=()):
+        """Flatten a stateful tree into a flat map.
+
+        Parameters
+        ----------
+        tree : dict, list, or State
+            Stateful tree.
+        path : tuple, default=()
+            Path of ``tree``.
+
+        Returns
+        -------
+        dict
+            Dict of paths to values, in depth first order.  Lists,
+            ``State`` objects, and empty dicts are values; non-empty
+            dicts are marked with ``_BRANCH`` before their items.
+
+        """
+        flat = {}
+        stack = [(path, tree)]
+
+        while stack:
+            (p, node) = stack.pop()
+
+            if isinstance(node, dict) and node:
+                flat[p] = _BRANCH
+                stack.extend(((*p, k), v) for (k, v) in reversed(node.items()))
+            else:
+                flat[p] = node
+
+        return flat
+
+    @staticmethod
+    def _merge_flat(left, right):
+        """Merge flat map ``right`` into flat map ``left`` in place.
+
+        Merge with the same rules as ``_merge()``, combining only the
+        values at the same path.
+
+        Parameters
+        ----------
+        left : dict
+            Left flat map, as from ``_flatten()``.
+        right : dict
+            Right flat map, as from ``_flatten()``.
+
+        Raises
+        ------
+        TypeError
+            Raises when ``left`` has a previously stored value that
+            does not match the similar value in ``right``.
+
+        """
+        for (path, value) in right.items():
+            existing = left.get(path, None)
+
+            if value is _BRANCH:
+                # Empty values are replaced by a dict.
+                if existing is not _BRANCH and existing:
+                    raise TypeError(
+                        f"merge type mismatch at {path!r};"
+                        f" right is a dict and left is a {type(existing)}"
+                    )
+
+                left[path] = _BRANCH
+            elif existing is _BRANCH:
+                # Empty dicts do not change a dict.
+                if not isinstance(value, dict):
+                    raise TypeError(
+                        f"merge type mismatch at {path!r};"
+                        f" right is a {type(value)} and left is a dict"
+                    )
+            elif existing is None:
+                left[path] = value
+            else:
+                left[path] = ElectiveConfig._merge(existing, value)
+
+    @staticmethod
+    def _copy_states(tree):
+        """Copy a stateful tree, without copying the ``State`` histories.
+
+        Copy the dicts, lists, and ``State`` objects of a tree, so
+        updating the copy leaves the tree unchanged.  The immutable
+        ``State`` histories are shared.
+        """
+        if isinstance(tree, State):
+            return copy.copy(tree)
+        if isinstance(tree, dict):
+            return {k: ElectiveConfig._copy_states(v) for (k, v) in tree.items()}
+        if isinstance(tree, list):
+            return [ElectiveConfig._copy_states(item) for item in tree]
+
+        return tree
+
+    @staticmethod
+    def _unflatten(flat):
+        """Rebuild a stateful tree from a flat map.
+
+        Parameters
+        ----------
+        flat : dict
+            Flat map, as from ``_flatten()``, with each path after
+            its parent.
+
+        Returns
+        -------
+        dict
+            The stateful tree.
+
+        """
+        root = {}
+        nodes = {(): root}
+
+        for (path, value) in flat.items():
+            if value is _BRANCH:
+                value = nodes[path] = {}
+
+            nodes[path[:-1]][path[-1]] = value
+
+        return root
+
+    @staticmethod
+    def _make_stateful(d, source, max_history=None):
         """Convert ``d`` from a dict to a stateful dict."""
         # Scalar types; return State.
         if any(
@@ -53,7 +524,7 @@ class ElectiveConfig:
                 d is None,
             )
         ):
-            return State((d, source))
+            return State((d, source), max_history=max_history)
 
         # Lists; recurse on items.
         if any(
@@ -65,7 +536,7 @@ class ElectiveConfig:
             res = []
 
             for item in d:
-                res.append(ElectiveConfig._make_stateful(item, source))
+                res.append(ElectiveConfig._make_stateful(item, source, max_history))
 
             return res
 
@@ -73,7 +544,7 @@ class ElectiveConfig:
         if isinstance(d, dict):
             res = {}
             for (k, v) in d.items():
-                res[k] = ElectiveConfig._make_stateful(v, source)
+                res[k] = ElectiveConfig._make_stateful(v, source, max_history)
 
             return res
 
@@ -110,21 +581,54 @@ class ElectiveConfig:
         cleaned["help"] = option.get("help", None)
         cleaned["dest"] = option.get("dest", None)
 
+        # Optional keys, only present when configured.
+        for key in _OPTIONAL_KEYS:
+            if key in option:
+                cleaned[key] = option[key]
+
+        return cleaned
+
+    @staticmethod
+    def _process_command(command):
+        """Process a subcommand and its options and subcommands."""
+        cleaned = {}
+        cleaned["help"] = command.get("help", None)
+        cleaned["options"] = {
+            k: ElectiveConfig._process_option(v)
+            for (k, v) in command.get("options", {}).items()
+        }
+        cleaned["commands"] = {
+            k: ElectiveConfig._process_command(v)
+            for (k, v) in command.get("commands", {}).items()
+        }
+
         return cleaned
 
     def _set_defaults(self, options):
         """Set the defaults from the options."""
-        for (k, v) in options.items():
-            self.defaults[k] = v["default"]
+        # Build a new dict, so cached default trees are not updated.
+        self._default_values = {k: v["default"] for (k, v) in options.items()}
 
-        self.defaults = ElectiveConfig._make_stateful(self.defaults, "default")
+        with self.tracer.span("stateful", provider="default"):
+            self.defaults = ElectiveConfig._make_stateful(
+                self._default_values,
+                "default",
+                self.elective["max_history"],
+            )
 
     def load_elective_config(self, fn):
         """Load configuration data."""
-        options = FileConfiguration._load_file(
-            fn=fn,
-            section="elective",
-        )
+        try:
+            with self.tracer.span("load_elective_config", fn=fn):
+                self._load_elective_config(fn)
+        finally:
+            self.tracer.flush()
+
+    def _load_elective_config(self, fn):
+        """Load and compile the elective configuration."""
+        file = FileConfiguration(fn, section=("elective",), tracer=self.tracer)
+        file.load()
+        options = file.options
 
         self.elective["description"] = options.get("description", None)
 
@@ -148,7 +652,27 @@ class ElectiveConfig:
             )
 
         self.elective["combine"] = options.get("combine", None)
-        self.elective["order"] = options.get("order", None)
+        self.elective["order"] = options.get("order", None) or self.elective["order"]
+        self.elective["sparse"] = options.get("sparse", False)
+        self.elective["max_history"] = options.get("max_history", None)
+
+        backend = options.get("backend", "state")
+
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"configured value for `backend` ({backend}) is not one of {_BACKENDS}"
+            )
+
+        self.elective["backend"] = backend
+
+        merge = options.get("merge", "tree")
+
+        if merge not in _MERGES:
+            raise ValueError(
+                f"configured value for `merge` ({merge}) is not one of {_MERGES}"
+            )
+
+        self.elective["merge"] = merge
 
         if "options" in options:
             self.options = {}
@@ -158,13 +682,91 @@ class ElectiveConfig:
             # Set defaults from options.
             self._set_defaults(options["options"])
 
+        # Subcommands are only available on the command line.
+        self.commands = {
+            k: ElectiveConfig._process_command(v)
+            for (k, v) in options.get("commands", {}).items()
+        }
+
+        # Compile the precedence plan once for all client loads; the
+        # environment loader is compiled on its first load.  Discard
+        # the cached provider trees and merges of the old schema.
+        self._env = None
+        self._providers = {}
+        self._flats = {}
+        self._merged = (None, None)
+        self._plan = _compile_plan(
+            self.elective["combine"],
+            self.elective["order"],
+            self.options,
+        )
+        self._check_backend(self._plan)
+
         self._configured = True
 
+    def _check_backend(self, plan):
+        """Check that the backend supports the plan's merge strategies.
+
+        Raises
+        ------
+        ValueError
+            Raises when options have merge strategies and the backend
+            is ``columnar``, which always appends lists.
+
+        """
+        if self.elective["backend"] == "columnar" and plan.strategies:
+            raise ValueError(
+                "options with merge strategies"
+                f" ({', '.join(plan.strategies)})"
+                " are not supported by the columnar backend"
+            )
+
+    def completion(self, shell):
+        """Generate a static shell completion script.
+
+        Generate a completion script for the command line options and
+        subcommands, which completes without running Python.
+
+        Parameters
+        ----------
+        shell : str
+            One of ``"bash"``, ``"fish"``, or ``"zsh"``.
+
+        Returns
+        -------
+        str
+            The completion script.
+
+        Raises
+        ------
+        ValueError
+            Raises when not configured or on an unsupported shell.
+
+        """
+        if not self._configured:
+            raise ValueError(
+                "``self.options`` is not configured.  "
+                "Call ``self.load_elective_config()`` first."
+            )
+
+        try:
+            generator = _completions[shell]
+        except KeyError:
+            raise ValueError(
+                f"shell ({shell}) is not one of {tuple(sorted(_completions))}"
+            ) from None
+
+        return generator(self.elective["name"], self.options, self.commands)
+
     @staticmethod
     def _merge(left, right, _debug=False):
         """Merge ``right`` into ``left``.
 
-        Merge ``right`` dictionary into ``left`` dictionary and return ``left``.
+        Merge ``right`` dictionary into ``left`` dictionary and return
+        the result, without modifying either.  Only the dicts, lists,
+        and ``State`` objects on paths that ``right`` changes are
+        copied; unchanged subtrees of ``left`` and ``right`` are
+        shared with the result.
 
         Parameters
         ----------
@@ -182,16 +784,14 @@ class ElectiveConfig:
 
         Raises
         ------
-        ValueError
+        TypeError
             Raises when ``left`` has a previously stored value that
-            does not match the similar value in ``right`` or when a
-            ``right`` value is not a dict, list, or ``State``.
+            does not match the similar value in ``right``.
+
         """
         # No left; return right.
         if not left:
-            return copy.deepcopy(right)
-
-        res = copy.deepcopy(left)
+            return right
 
         # Scalars; combine right into left.
         if isinstance(right, State):
@@ -199,23 +799,19 @@ class ElectiveConfig:
 
             if not isinstance(left, State):
                 raise TypeError(
-                    f"merge type mismatch; right is a State and left is a {type(res)}"
+                    f"merge type mismatch; right is a State and left is a {type(left)}"
                 )
 
-            if (right.current is None and left.current is None) or (
-                right.current is not None
-            ):
-                res.append(right)
+            if right.current is None and left.current is not None:
+                return left
+
+            res = copy.copy(left)
+            res.append(right)
 
             return res
 
-        # List types; recurse on common items.
-        if any(
-            (
-                isinstance(right, list),
-                isinstance(right, tuple),
-            )
-        ):
+        # List types; append right items.
+        if isinstance(right, (list, tuple)):
             print("merging lists") if _debug else None
 
             if not isinstance(left, list):
@@ -225,10 +821,7 @@ class ElectiveConfig:
                     f" and left is a {type(left)}, but should be a list"
                 )
 
-            for item in right:
-                res.append(copy.deepcopy(item))
-
-            return res
+            return [*left, *right]
 
         # Dicts; recurse on common key/value pairs.
         if isinstance(right, dict):
@@ -238,78 +831,448 @@ class ElectiveConfig:
                 raise TypeError(
                     "merge type mismatch;"
                     " right is a dict"
-                    "and left is a {type(left)}, but should be a dict"
+                    f" and left is a {type(left)}, but should be a dict"
                 )
 
+            res = dict(left)
+
             for (k, v) in right.items():
                 if k in left:
                     # Exists in left; merge.
                     print("merging dict entries") if _debug else None
                     res[k] = ElectiveConfig._merge(left[k], v)
                 else:
-                    # Not in left; append.
+                    # Not in left; share.
                     print("appending dict entries") if _debug else None
-                    res[k] = copy.deepcopy(v)
+                    res[k] = v
 
             return res
 
-    def load_client_config(self, *args, **kwargs):
-        """Load the client configuration options."""
-        if not self._configured:
-            raise ValueError(
-                "``self.options`` is not configured.  "
-                "Call ``self.load_elective_config()`` first."
+    def _stateful_providers(self, raw):
+        """Convert the raw provider options to stateful trees.
+
+        Reuse the stateful tree of each provider whose options are
+        unchanged since the previous load.
+
+        Returns
+        -------
+        tuple
+            The dict of provider names to stateful trees and the set
+            of top level keys touched by changed providers, before or
+            after the change.
+
+        """
+        previous = self._providers
+        opts = {}
+        affected = set()
+
+        for (name, values) in raw.items():
+            cached = previous.get(name, None)
+
+            if cached is not None and _same(cached[0], values):
+                opts[name] = cached[1]
+                continue
+
+            start = time.perf_counter()
+
+            with self.tracer.span("stateful", provider=name) as span:
+                opts[name] = ElectiveConfig._make_stateful(
+                    values,
+                    "default" if name == "defaults" else name,
+                    self.elective["max_history"],
+                )
+                span.set(keys=len(values))
+
+            self._pending_stats.provider(name).stateful_time = (
+                time.perf_counter() - start
             )
 
-        argv = kwargs.pop("argv", None)
+            affected.update(opts[name])
+            self._flats.pop(name, None)
 
-        opts = {
-            "defaults": self.defaults,
-        }
+            if cached is not None:
+                affected.update(cached[1])
+
+        for (name, cached) in previous.items():
+            if name not in raw:
+                affected.update(cached[1])
+                self._flats.pop(name, None)
+
+        self._providers = {name: (raw[name], opts[name]) for name in raw}
+
+        return (opts, affected)
+
+    def _remerge(self, plan, opts, affected):
+        """Merge the stateful provider trees in plan order.
+
+        Merge each top level key independently, reusing the previous
+        merged value of keys that no changed provider touched.  The
+        previous merge is discarded if ``order``, ``max_history``, or
+        the ``merge`` engine changed.  The merged values share
+        unchanged subtrees with the provider trees and previous
+        merges; copy them with ``_copy_states()`` before exposing
+        them.
+
+        Parameters
+        ----------
+        plan : _Plan
+            The precedence plan.
+        opts : dict
+            Dict of provider names to stateful trees.
+        affected : set
+            Top level keys touched by changed providers.
+
+        Returns
+        -------
+        dict
+            The merged configuration.
+
+        """
+        key = (
+            plan.providers,
+            self.elective["max_history"],
+            self.elective["merge"],
+        )
+        sources = [source for source in plan.providers if opts.get(source)]
+
+        # Previous values of keys that no changed provider touched.
+        (previous_key, previous) = self._merged
+        if previous_key != key:
+            previous = None
+        else:
+            previous = {k: v for (k, v) in previous.items() if k not in affected}
+
+        merged = {}
+        flats = {}
+
+        for source in sources:
+            start = time.perf_counter()
+            with self.tracer.span("merge_step", provider=source):
+                self._merge_source(plan, merged, flats, source, opts[source], previous)
+            self._pending_stats.provider(source).merge_time += (
+                time.perf_counter() - start
+            )
+
+        for (k, flat) in flats.items():
+            merged[k] = ElectiveConfig._unflatten(flat)[k]
+
+        self._merged = (key, merged)
+
+        return merged
+
+    def _merge_source(self, plan, merged, flats, source, tree, previous):
+        """Merge a provider's stateful tree into ``merged`` in place.
 
-        # Load CLI options.
+        Keys in ``previous``, if set, reuse their previous value, and
+        flat maps are merged into ``flats`` with the flat engine.
+        """
+        for (k, v) in tree.items():
+            if previous is not None and k in previous:
+                merged[k] = previous[k]
+            elif k in plan.strategies:
+                merged[k] = ElectiveConfig._merge_list(
+                    merged.get(k, None), v, *plan.strategies[k]
+                )
+            elif self.elective["merge"] == "flat":
+                # Placeholder, to keep the key order.
+                merged[k] = None
+                ElectiveConfig._merge_flat(
+                    flats.setdefault(k, {}),
+                    self._provider_flats(source, tree)[k],
+                )
+            elif k in merged:
+                merged[k] = ElectiveConfig._merge(merged[k], v)
+            else:
+                merged[k] = v
+
+    def _provider_flats(self, source, tree):
+        """Get the flat maps of a provider's top level keys.
+
+        Flatten each provider tree once, and reuse the flat maps
+        until the provider changes.
+        """
+        flats = self._flats.get(source, None)
+
+        if flats is None:
+            flats = {k: ElectiveConfig._flatten(v, (k,)) for (k, v) in tree.items()}
+            self._flats[source] = flats
+
+        return flats
+
+    def _load_cli(self, argv=None):
+        """Load the raw CLI options."""
         cli = CliConfiguration(
             description=self.elective["description"],
             options=self.options,
+            commands=self.commands,
+            sparse=self.elective["sparse"],
         )
         cli.config()
         cli.load(argv=argv)
-        opts["cli"] = ElectiveConfig._make_stateful(cli.options, "cli")
 
-        # Load file options.
+        return cli.options
+
+    def _load_env(self):
+        """Load the raw environment options."""
+        if self._env is None:
+            self._env = EnvConfiguration(
+                prefix=self.elective["prefix"],
+                schema=self.options,
+            )
+
+        self._env.load()
+
+        return self._env.options
+
+    def _load_file(self, fmt):
+        """Load the raw options from the client file in ``fmt``."""
         file = FileConfiguration(
-            order=self.elective["order"],
-            fn=self.elective["name"],
+            f".{self.elective['name']}.{fmt}",
+            section=(self.elective["name"],),
+            raise_on_file_error=False,
+            tracer=self.tracer,
         )
-        file.load(section=self.elective["name"])
-        for (k, v) in file.options.items():
-            opts[k] = ElectiveConfig._make_stateful(v, k)
-
-        self.config = {}
-
-        if self.elective["combine"] is None:
-            self.elective["order"].reverse()
-            for source in self.elective["order"]:
-                try:
-                    self.config = opts[source]
-                    break
-                except (KeyError):
-                    pass
+        file.load()
+        self.tracer.count("bytes_read", file.bytes_read, provider=fmt)
+
+        stats = self._pending_stats.provider(fmt)
+        stats.bytes_read = file.bytes_read
+        stats.attempts = file.attempts
+        stats.failures = file.failures
+
+        return file.options
+
+    def _provider_plan(self):
+        """Get the precedence plan.
+
+        The plan compiled by ``load_elective_config()`` is reused
+        until ``elective["combine"]`` or ``elective["order"]``
+        change.
+        """
+        plan = self._plan
+        key = (self.elective["combine"], tuple(self.elective["order"]))
+
+        if plan is None or plan.key != key:
+            plan = _compile_plan(
+                self.elective["combine"],
+                self.elective["order"],
+                self.options,
+            )
+            self._plan = plan
+
+        return plan
+
+    def _provider_loaders(self, plan, argv=None):
+        """Get the loader of each provider in the plan.
+
+        Returns
+        -------
+        dict
+            Dict of provider names, in plan order, to functions
+            returning their raw options.
+
+        """
+        loaders = {
+            "defaults": lambda: self._default_values,
+            "cli": functools.partial(self._load_cli, argv),
+            "env": self._load_env,
+        }
+
+        for fmt in _FILE_FORMATS:
+            loaders[fmt] = functools.partial(self._load_file, fmt)
+
+        return {name: loaders[name] for name in plan.providers}
+
+    def _load_provider(self, plan, name, loader):
+        """Load a provider's options, dropping options it may not set."""
+        stats = self._pending_stats.provider(name)
+        start = time.perf_counter()
+
+        with self.tracer.span("parse", provider=name) as span:
+            values = loader()
+            drops = plan.drops.get(name, None)
+
+            if drops and not drops.isdisjoint(values):
+                values = {k: v for (k, v) in values.items() if k not in drops}
+
+            span.set(keys=len(values))
+
+        stats.wall_time = time.perf_counter() - start
+        stats._set_values(values)
+
+        return values
+
+    def _load_providers(self, plan, argv=None, executor=None):
+        """Load the raw client options from each provider.
+
+        Parameters
+        ----------
+        plan : _Plan
+            The precedence plan.
+        argv : list, default=None
+            Command line arguments.
+        executor : concurrent.futures.Executor, default=None
+            Executor to run the providers concurrently on, or ``None``
+            to run them in turn.
+
+        Returns
+        -------
+        dict
+            Dict of provider names, in plan order, to their options.
+
+        """
+        loaders = self._provider_loaders(plan, argv)
+
+        # Add the statistics in plan order.
+        for name in loaders:
+            self._pending_stats.provider(name)
+
+        if executor is None:
+            return {
+                name: self._load_provider(plan, name, loader)
+                for (name, loader) in loaders.items()
+            }
+
+        futures = {
+            name: executor.submit(self._load_provider, plan, name, loader)
+            for (name, loader) in loaders.items()
+        }
+
+        # Collect in plan order, so results and errors are deterministic.
+        return {name: future.result() for (name, future) in futures.items()}
+
+    def _load_first_provider(self, plan, argv=None):
+        """Load the highest precedence provider with options.
+
+        Load providers lazily, from the end of ``order``, and stop at
+        the first with options, so that lower precedence providers
+        are never loaded.
+
+        Returns
+        -------
+        tuple
+            The provider's name and raw options, or ``(None, {})`` if
+            no provider has options.
+
+        """
+        for (name, loader) in self._provider_loaders(plan, argv).items():
+            values = self._load_provider(plan, name, loader)
+
+            if values:
+                return (name, values)
+
+        return (None, {})
+
+    def _combine_columnar(self, plan, raw):
+        """Combine the provider options in a columnar provenance store.
+
+        Merge the providers in the same order and with the same rules
+        as the ``State`` backend, but record each leaf value as a row
+        in ``self.provenance`` instead of a ``State``.  ``self.config``
+        is a read only view of the store, building each leaf's
+        ``State`` only when it is accessed.
+        """
+        self._check_backend(plan)
+        store = ProvenanceStore(max_history=self.elective["max_history"])
+
+        with self.tracer.span("merge", backend="columnar") as span:
+            for name in plan.providers:
+                if raw.get(name, None):
+                    start = time.perf_counter()
+                    with self.tracer.span("merge_step", provider=name):
+                        store.merge(raw[name], plan.sources[name])
+                    self._pending_stats.provider(name).merge_time = (
+                        time.perf_counter() - start
+                    )
+
+            span.set(keys=len(store.current), rows=len(store))
+
+        self.provenance = store
+        self.config = store.view()
+
+    def load_client_config(self, *args, **kwargs):
+        """Load the client configuration options.
+
+        If ``combine`` is ``None``, only the highest precedence
+        provider with options is loaded and used.  Otherwise, the
+        providers are loaded concurrently on ``executor`` (or
+        ``self.executor``), if set, and merged in precedence order.
+        """
+        if not self._configured:
+            raise ValueError(
+                "``self.options`` is not configured.  "
+                "Call ``self.load_elective_config()`` first."
+            )
+
+        argv = kwargs.pop("argv", None)
+        executor = kwargs.pop("executor", self.executor)
+        plan = self._provider_plan()
+
+        stats = self._pending_stats = LoadStats()
+        start = time.perf_counter()
+
+        try:
+            with self.tracer.span(
+                "load_client_config",
+                combine=plan.combine,
+                backend=self.elective["backend"],
+            ):
+                self._load_client_config(plan, argv, executor)
+        finally:
+            self._pending_stats = None
+            self.tracer.flush()
+
+        stats.wall_time = time.perf_counter() - start
+        self.stats = stats
+
+    def _load_client_config(self, plan, argv, executor):
+        """Load and merge the providers of a plan."""
+        if plan.combine is None:
+            (name, values) = self._load_first_provider(plan, argv)
+            raw = {name: values}
         else:
-            final = {}
-
-            if self.elective["combine"] == "right":
-                self.elective["order"].reverse()
-
-            for source in self.elective["order"]:
-                try:
-                    print(opts[source])
-                    if not final and opts[source]:
-                        final = opts[source]
-                    elif opts[source]:
-                        final = ElectiveConfig._merge(final, opts[source])
-                    print(final)
-                except (KeyError):
-                    pass
-
-            self.config = final
+            raw = self._load_providers(plan, argv, executor)
+
+        stats = self._pending_stats
+
+        if self.elective["backend"] == "columnar":
+            start = time.perf_counter()
+            self._combine_columnar(plan, raw)
+            stats.merge_time = time.perf_counter() - start
+            return
+
+        if plan.combine is None:
+            start = time.perf_counter()
+
+            with self.tracer.span("stateful", provider=name) as span:
+                self.config = ElectiveConfig._make_stateful(
+                    values,
+                    plan.sources.get(name, None),
+                    self.elective["max_history"],
+                )
+                span.set(keys=len(values))
+
+            if name is not None:
+                stats.provider(name).stateful_time = time.perf_counter() - start
+
+            return
+
+        try:
+            (opts, affected) = self._stateful_providers(raw)
+            start = time.perf_counter()
+
+            with self.tracer.span("merge", backend="state") as span:
+                # Copy the states shared with the cached trees.
+                self.config = ElectiveConfig._copy_states(
+                    self._remerge(plan, opts, affected)
+                )
+                span.set(keys=len(self.config), affected=len(affected))
+        except Exception:
+            # Discard the caches of a failed load, so the next load
+            # merges every provider again.
+            self._providers = {}
+            self._flats = {}
+            self._merged = (None, None)
+            raise
+
+        stats.merge_time = time.perf_counter() - start
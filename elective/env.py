@@ -12,10 +12,123 @@
 
 """Environment loading utilities."""
 
+import json
 import os
 
+from .cli import _to_dict, _value_converters
 from .config import Configuration
-from .util import _flatten_to_list, _format_sh
+from .util import _build_tree, _flatten_to_list, _format_sh
+
+_TRUE = frozenset(("true", "yes", "on", "1"))
+_FALSE = frozenset(("false", "no", "off", "0"))
+
+
+def _env_to_bool(value):
+    """Convert an environment string to a boolean."""
+    if not isinstance(value, str):
+        raise TypeError(f"{value!r} is not a boolean")
+
+    folded = value.strip().lower()
+
+    if folded in _TRUE:
+        return True
+    if folded in _FALSE:
+        return False
+
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _env_to_list(value):
+    """Convert an environment string to a list.
+
+    Lists reconstructed from separated variables are returned as is;
+    strings are split on commas, as on the command line.
+    """
+    if isinstance(value, list):
+        return value
+
+    if not isinstance(value, str):
+        raise TypeError(f"{value!r} is not a list")
+
+    if len(value) == 0:
+        return []
+
+    return [item.strip() for item in value.split(",")]
+
+
+def _env_to_json(value):
+    """Convert an environment string from JSON."""
+    if not isinstance(value, str):
+        return value
+
+    return json.loads(value)
+
+
+def _env_to_dict(value):
+    """Convert an environment string to a dict.
+
+    Dicts reconstructed from separated variables are returned as is;
+    strings are converted from ``key=value`` pairs, as on the command
+    line.
+    """
+    if isinstance(value, dict):
+        return value
+
+    if not isinstance(value, str):
+        raise TypeError(f"{value!r} is not a dict")
+
+    return _to_dict(value)
+
+
+# Environment specific converters; other option types use the command
+# line converters, or are loaded as strings.
+_CONVERTERS = {
+    "boolean": _env_to_bool,
+    "boolean_group": _env_to_bool,
+    "list": _env_to_list,
+    "dict": _env_to_dict,
+    "json": _env_to_json,
+}
+
+# Option types without values.
+_VALUELESS = frozenset(("display",))
+
+
+def _env_name(option):
+    """Get the environment variable name of an option."""
+    return option.upper().replace("-", "_")
+
+
+def _compile_converters(schema):
+    """Compile the environment converters for an options schema.
+
+    Parameters
+    ----------
+    schema : dict
+        Options schema, as in ``ElectiveConfig.options``.
+
+    Returns
+    -------
+    dict
+        Dict of environment variable names (without prefix) to
+        ``(option, converter)`` pairs.
+
+    """
+    converters = {}
+
+    for option, spec in schema.items():
+        if not isinstance(spec, dict):
+            continue
+
+        kind = spec.get("type", None)
+
+        if kind in _VALUELESS:
+            continue
+
+        converter = _CONVERTERS.get(kind, None) or _value_converters.get(kind, str)
+        converters[_env_name(option)] = (option, converter)
+
+    return converters
 
 
 class EnvConfiguration(Configuration):
@@ -26,6 +139,12 @@ class EnvConfiguration(Configuration):
         # Defaults.
         self.prefix = kwargs.pop("prefix", "ELECTIVE_")
         self.separator = kwargs.pop("separator", "__")
+        self.schema = kwargs.pop("schema", None) or {}
+        self._converters = _compile_converters(self.schema)
+
+        # Prefixed variables and top level subtrees from the last load.
+        self._snapshot = {}
+        self._subtrees = {}
 
         # Call the super.
         super().__init__(*args, **kwargs)
@@ -38,38 +157,90 @@ class EnvConfiguration(Configuration):
         number variables directly from the environment and reconstruct
         lists and hashes from properly formatted series of environment
         variables.
+
+        If the loader has an options ``schema``, variables named for
+        an option (upper case, with ``-`` replaced by ``_``) are
+        stored under the option name and converted to the option's
+        ``type``.  Other variables are left as strings.
+
+        Only the top level subtrees with variables that were added,
+        changed, or removed since the previous load are rebuilt;
+        unchanged subtrees are reused.
+
+        Raises
+        ------
+        ElectivePathConflictError
+            Raises when a variable is both a value and the parent of
+            other variables.
+        ValueError
+            Raises when a variable cannot be converted to the type of
+            its option.
+
+        """
+        snapshot = {
+            key.removeprefix(self.prefix): value
+            for key, value in os.environ.items()
+            if key.startswith(self.prefix)
+        }
+
+        if snapshot == self._snapshot:
+            return
+
+        changed = self._changed_tops(snapshot)
+
+        config = _flatten_to_list(
+            _build_tree(
+                (name.split(self.separator), value)
+                for name, value in snapshot.items()
+                if name.split(self.separator, 1)[0] in changed
+            )
+        )
+
+        subtrees = dict(self._subtrees)
+        for top in changed:
+            if top in config:
+                subtrees[top] = self._coerce(top, config[top])
+            else:
+                subtrees.pop(top, None)
+
+        self._snapshot = snapshot
+        self._subtrees = subtrees
+        self.options = dict(subtrees.values())
+
+    def _changed_tops(self, snapshot):
+        """Find the top level keys with changed variables."""
+        previous = self._snapshot
+        names = [
+            name for name, value in snapshot.items() if previous.get(name) != value
+        ]
+        names.extend(name for name in previous if name not in snapshot)
+
+        return {name.split(self.separator, 1)[0] for name in names}
+
+    def _coerce(self, name, value):
+        """Convert a top level value to its schema type.
+
+        Returns
+        -------
+        tuple
+            The option name and converted value, or ``name`` and
+            ``value`` for variables that are not in the schema.
+
         """
-        config = {}
-
-        for key, value in os.environ.items():
-            if key.startswith(self.prefix):
-                # Find the prefixed values and strip the prefix.
-                name = key.removeprefix(self.prefix)
-
-                if self.separator not in name:
-                    # Find the non-dict and non-list pairs and add them to
-                    # the dict.
-                    config[name] = value
-                else:
-                    # Handle the flattened data structures, treating the
-                    # list type variables as dicts.
-                    # Based on:
-                    # https://gist.github.com/fmder/494aaa2dd6f8c428cede
-                    keys = name.split(self.separator)
-                    sub_config = config
-                    for k in keys[:-1]:
-                        try:
-                            if not isinstance(sub_config[k], dict):
-                                raise Exception(
-                                    f"{k} is defined multiple times in the environment."
-                                )
-                            sub_config = sub_config[k]
-                        except KeyError:
-                            sub_config[k] = {}
-                            sub_config = sub_config[k]
-                    sub_config[keys[-1]] = value
-
-        self.options = _flatten_to_list(config)
+        compiled = self._converters.get(name, None)
+
+        if compiled is None:
+            return (name, value)
+
+        (option, converter) = compiled
+
+        try:
+            return (option, converter(value))
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"{self.prefix}{name} ({value!r}) is not a valid"
+                f" {self.schema[option]['type']}"
+            ) from error
 
     def dump(self, formatter=_format_sh):
         """Dump configuration as environment variable strings.
@@ -28,3 +28,23 @@ class ElectiveFileDecodingError(Exception):
     def __repr__(self):
         """Reproduce an ``ElectiveFileDecodingError``."""
         return f"ElectiveFileDecodingError(message={self.message!r},)"
+
+
+class ElectivePathConflictError(Exception):
+    """Key path conflict error."""
+
+    def __init__(self, message, path=None, *args, **kwargs):
+        """Initialize an ``ElectivePathConflictError``."""
+        super().__init__(*args, **kwargs)
+        self.message = message
+        self.path = path
+
+    def __str__(self):
+        """Stringify an ``ElectivePathConflictError``."""
+        return self.message
+
+    def __repr__(self):
+        """Reproduce an ``ElectivePathConflictError``."""
+        return (
+            f"ElectivePathConflictError(message={self.message!r}, path={self.path!r},)"
+        )
@@ -12,8 +12,11 @@
 
 """File loading utilities."""
 
+import os
+
 from .config import Configuration
 from .exceptions import ElectiveFileDecodingError
+from .tracing import _NULL_TRACER
 from .util import (
     _bespon_file_loader,
     _json_file_loader,
@@ -26,14 +29,26 @@ class FileConfiguration(Configuration):
     """File configuration loader."""
 
     def __init__(
-        self, fn, section=None, raise_on_decode_error=False, raise_on_file_error=True
+        self,
+        fn,
+        section=None,
+        raise_on_decode_error=False,
+        raise_on_file_error=True,
+        tracer=_NULL_TRACER,
     ):
         """Initialize a file configuration."""
         self.fn = fn
+        self.tracer = tracer
         self.section = section
         self.raise_on_decode_error = raise_on_decode_error
         self.raise_on_file_error = raise_on_file_error
 
+        # Bytes read, loaders tried, and loaders failed by the last
+        # load.
+        self.bytes_read = 0
+        self.attempts = 0
+        self.failures = 0
+
         self.loaders = [
             _toml_file_loader,
             _yaml_file_loader,
@@ -41,21 +56,42 @@ class FileConfiguration(Configuration):
             _bespon_file_loader,
         ]
 
+    def _size(self):
+        """Get the size of the file, or 0 if it cannot be read."""
+        try:
+            return os.path.getsize(self.fn)
+        except OSError:
+            return 0
+
     def load(self):
         """Load configuration file."""
+        self.bytes_read = 0
+        self.attempts = 0
+        self.failures = 0
+
         for loader in self.loaders:
+            self.attempts += 1
+
             try:
-                self.options = loader(
-                    self.fn,
-                    section=self.section,
-                )
+                with self.tracer.span(
+                    "file_loader", fn=self.fn, loader=loader.__name__
+                ):
+                    self.options = loader(
+                        self.fn,
+                        section=self.section,
+                    )
+
+                self.bytes_read += self._size()
 
                 return
 
             except ElectiveFileDecodingError:
-                pass
+                self.bytes_read += self._size()
+                self.failures += 1
 
             except FileNotFoundError:
+                self.failures += 1
+
                 if self.raise_on_file_error:
                     raise
 
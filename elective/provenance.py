@@ -0,0 +1,297 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Columnar provenance store."""
+
+from array import array
+from collections.abc import Mapping, Sequence
+
+from .state import State, _intern_source, _sources
+
+# Node kinds.
+_LEAF = 0
+_DICT = 1
+_LIST = 2
+
+
+class ProvenanceStore:
+    """Columnar configuration provenance.
+
+    Record every value merged into a configuration as a row of leaf
+    path id, source id, and value, with the path and source ids in
+    ``array`` columns.  The current value of each leaf is kept in a
+    separate map, and ``State`` objects are built only on request.
+    """
+
+    def __init__(self, max_history=None):
+        """Initialize an empty provenance store.
+
+        Parameters
+        ----------
+        max_history : int, default=None
+            Maximum number of entries in the ``State`` views, or
+            ``None`` for the full history.
+
+        """
+        self.max_history = max_history
+
+        # Paths by id and ids by path.
+        self._paths = []
+        self._path_ids = {}
+
+        # Columns.
+        self._path_column = array("L")
+        self._source_column = array("L")
+        self._value_column = []
+
+        # Current value and source id of each leaf path.
+        self.current = {}
+        self._current_sources = {}
+
+        # Node kinds and child keys (dicts) or lengths (lists).
+        self._kinds = {(): _DICT}
+        self._children = {(): {}}
+
+        # Rows of each path id, built on request.
+        self._rows = None
+
+    def __len__(self):
+        """Get the number of recorded rows."""
+        return len(self._value_column)
+
+    def _path_id(self, path):
+        """Get the id of a path, adding it if new."""
+        path_id = self._path_ids.get(path, None)
+
+        if path_id is None:
+            path_id = len(self._paths)
+            self._paths.append(path)
+            self._path_ids[path] = path_id
+
+        return path_id
+
+    def _add_node(self, path, kind):
+        """Add a node to its parent, or check its kind if it exists."""
+        existing = self._kinds.get(path, None)
+
+        # Like ``ElectiveConfig._merge()``, replace empty nodes.
+        if existing is not None and (
+            existing == _LEAF or self._children[path] or kind == existing
+        ):
+            if existing != kind:
+                raise TypeError(
+                    f"merge type mismatch at {path!r};"
+                    f" cannot merge a {_KIND_NAMES[kind]}"
+                    f" into a {_KIND_NAMES[existing]}"
+                )
+
+            return False
+
+        if existing is None:
+            parent = self._children[path[:-1]]
+
+            if self._kinds[path[:-1]] == _DICT:
+                parent[path[-1]] = None
+            else:
+                self._children[path[:-1]] = parent + 1
+
+        self._kinds[path] = kind
+
+        if kind == _DICT:
+            self._children[path] = {}
+        elif kind == _LIST:
+            self._children[path] = 0
+        else:
+            self._children.pop(path, None)
+
+        return True
+
+    def _record(self, path, value, source_id):
+        """Record a leaf value."""
+        self._path_column.append(self._path_id(path))
+        self._source_column.append(source_id)
+        self._value_column.append(value)
+        self.current[path] = value
+        self._current_sources[path] = source_id
+        self._rows = None
+
+    def merge(self, tree, source):
+        """Merge a provider's configuration into the store.
+
+        Merge like ``ElectiveConfig._merge()``:  new values are
+        added, ``None`` does not replace an existing value, and lists
+        are extended.
+
+        Parameters
+        ----------
+        tree : dict
+            The provider's configuration.
+        source : str
+            The provider's source.
+
+        Raises
+        ------
+        TypeError
+            Raises when a value's type does not match the type of the
+            value it merges into.
+
+        """
+        source_id = _intern_source(source)
+        stack = [((), tree)]
+
+        while stack:
+            (path, node) = stack.pop()
+
+            if isinstance(node, dict):
+                self._add_node(path, _DICT)
+                stack.extend(((*path, k), v) for (k, v) in reversed(node.items()))
+            elif isinstance(node, (list, tuple)):
+                self._add_node(path, _LIST)
+                offset = self._children[path]
+                stack.extend(
+                    ((*path, offset + i), node[i]) for i in reversed(range(len(node)))
+                )
+            elif isinstance(node, (str, bool, int, float)) or node is None:
+                if self._add_node(path, _LEAF) or (
+                    node is not None or self.current[path] is None
+                ):
+                    self._record(path, node, source_id)
+            else:
+                raise NotImplementedError(
+                    f"stateful handling of type {type(node)} is not implemented"
+                )
+
+    def state(self, path):
+        """Get a ``State`` view of a leaf's history.
+
+        Parameters
+        ----------
+        path : tuple
+            The leaf's path.
+
+        Returns
+        -------
+        State
+            A new ``State`` with the leaf's history.
+
+        Raises
+        ------
+        KeyError
+            Raises when ``path`` is not a leaf.
+
+        """
+        if self._kinds.get(path, None) != _LEAF:
+            raise KeyError(path)
+
+        if self._rows is None:
+            self._rows = {}
+            for row, path_id in enumerate(self._path_column):
+                self._rows.setdefault(path_id, []).append(row)
+
+        state = State(max_history=self.max_history)
+        for row in self._rows[self._path_ids[path]]:
+            state.update(self._value_column[row], _sources[self._source_column[row]])
+
+        return state
+
+    def source(self, path):
+        """Get the current source of a leaf."""
+        return _sources[self._current_sources[path]]
+
+    def view(self, path=()):
+        """Get a lazy view of the node at ``path``.
+
+        Dicts are viewed as mappings and lists as sequences, with
+        ``State`` views of leaves built when accessed.
+        """
+        kind = self._kinds[path]
+
+        if kind == _DICT:
+            return _MappingView(self, path)
+        if kind == _LIST:
+            return _SequenceView(self, path)
+
+        return self.state(path)
+
+
+_KIND_NAMES = {
+    _LEAF: "State",
+    _DICT: "dict",
+    _LIST: "list",
+}
+
+
+class _MappingView(Mapping):
+    """Lazy view of a dict in a provenance store."""
+
+    def __init__(self, store, path):
+        """Initialize a mapping view."""
+        self._store = store
+        self._path = path
+
+    def __getitem__(self, key):
+        """Get a view of a child."""
+        path = (*self._path, key)
+
+        if path not in self._store._kinds:
+            raise KeyError(key)
+
+        return self._store.view(path)
+
+    def __iter__(self):
+        """Iterate over the child keys."""
+        return iter(self._store._children[self._path])
+
+    def __len__(self):
+        """Get the number of children."""
+        return len(self._store._children[self._path])
+
+    def __repr__(self):
+        """Reproduce a mapping view."""
+        return repr(dict(self.items()))
+
+
+class _SequenceView(Sequence):
+    """Lazy view of a list in a provenance store."""
+
+    def __init__(self, store, path):
+        """Initialize a sequence view."""
+        self._store = store
+        self._path = path
+
+    def __getitem__(self, index):
+        """Get a view of a child."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        return self._store.view((*self._path, index))
+
+    def __len__(self):
+        """Get the number of children."""
+        return self._store._children[self._path]
+
+    def __eq__(self, other):
+        """Compare with another sequence."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self):
+        """Reproduce a sequence view."""
+        return repr(list(self))
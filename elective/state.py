@@ -13,12 +13,51 @@
 """Scalar variable value and history support."""
 
 import math
+import threading
+
+# Source id of a state without history.
+_EMPTY = -1
+
+# Interned sources:  ids by source and sources by id.
+_source_ids = {}
+_sources = []
+_sources_lock = threading.Lock()
+
+
+def _intern_source(source):
+    """Get the small integer id of a source, interning it if new."""
+    source_id = _source_ids.get(source, None)
+
+    if source_id is None:
+        with _sources_lock:
+            source_id = _source_ids.get(source, None)
+
+            if source_id is None:
+                source_id = len(_sources)
+                _sources.append(source)
+                _source_ids[source] = source_id
+
+    return source_id
+
+
+# Intern the built in providers first.
+for _source in ("default", "cli", "env", "toml", "json", "yaml", "bespon"):
+    _intern_source(_source)
 
 
 class State:
-    """A variable with history."""
+    """A variable with history.
+
+    The current value and source are stored directly; earlier
+    entries are kept in a tuple of value and source pairs, which is
+    empty for the common single entry state.  With ``max_history``,
+    the history is a ring of the most recent entries.  Sources are
+    stored as interned ids, shared by all states.
+    """
+
+    __slots__ = ("_current", "_history", "_max_history", "_source")
 
-    def __init__(self, *args):
+    def __init__(self, *args, max_history=None):
         """Initialize a state.
 
         Initialize a state with the tuples supplied in ``args``.
@@ -27,64 +66,119 @@ class State:
         ----------
         args : iterable
             An iterable of tuples of value and source pairs.
+        max_history : int, default=None
+            Maximum number of entries to keep, including the current
+            entry, or ``None`` to keep all entries.
+
+        Raises
+        ------
+        ValueError
+            Raises when ``max_history`` is less than one.
 
         """
-        self.values = []
-        self.sources = []
+        if max_history is not None and max_history < 1:
+            raise ValueError(f"max_history ({max_history}) must be at least 1")
+
         self._current = None
+        self._source = _EMPTY
+        self._history = ()
+        self._max_history = max_history
 
         for pair in args:
             self.update(pair[0], pair[1])
 
     def __str__(self):
         """Stringify a state."""
-        if self.values:
-            return f"current value: {self.values[-1]} source: {self.sources[-1]}"
+        if self._source != _EMPTY:
+            return f"current value: {self._current} source: {_sources[self._source]}"
         else:
             return "current value: None source: None"
 
     def __repr__(self):
         """Reproduce a state."""
-        if self.values:
-            return f"State(({self.values[-1]}, {self.sources[-1]}))"
+        if self._source != _EMPTY:
+            return f"State(({self._current}, {_sources[self._source]}))"
         else:
             return "State((, ))"
 
     def __eq__(self, other):
         """Determine if two states are equal."""
-        if all(
+        if not isinstance(other, State):
+            return NotImplemented
+
+        if self._source == _EMPTY or other._source == _EMPTY:
+            return False
+
+        if self._source != other._source:
+            return False
+
+        if isinstance(self._current, float) and isinstance(other._current, float):
+            if math.isnan(self._current) and math.isnan(other._current):
+                return True
+
+        return self._current == other._current
+
+    def __copy__(self):
+        """Copy a state."""
+        copied = State.__new__(State)
+        copied._current = self._current
+        copied._source = self._source
+        copied._history = self._history
+        copied._max_history = self._max_history
+
+        return copied
+
+    def __deepcopy__(self, memo):
+        """Copy a state; the history is immutable and shared."""
+        return self.__copy__()
+
+    def __reduce__(self):
+        """Pickle a state by source names, not process local ids."""
+        return (
+            _unpickle_state,
             (
-                len(self.values) > 0,
-                len(other.values) > 0,
-                len(self.sources) > 0,
-                len(other.sources) > 0,
-            )
-        ):
-            if all(
-                (
-                    isinstance(self.values[-1], float),
-                    isinstance(other.values[-1], float),
-                )
-            ):
-                if all(
-                    (
-                        math.isnan(self.values[-1]),
-                        math.isnan(other.values[-1]),
-                    )
-                ):
-                    return self.sources[-1] == other.sources[-1]
-                else:
-                    return (
-                        self.values[-1] == other.values[-1]
-                        and self.sources[-1] == other.sources[-1]
-                    )
-            else:
-                return (
-                    self.values[-1] == other.values[-1]
-                    and self.sources[-1] == other.sources[-1]
-                )
-
-        return False
+                tuple((value, _sources[source]) for (value, source) in self._pairs()),
+                self._max_history,
+            ),
+        )
+
+    def _pairs(self):
+        """Get the history as a tuple of value and source id pairs."""
+        if self._source == _EMPTY:
+            return ()
+
+        return (*self._history, (self._current, self._source))
+
+    @property
+    def values(self):
+        """Get the values, oldest first."""
+        return [value for (value, _) in self._pairs()]
+
+    @property
+    def sources(self):
+        """Get the sources, oldest first."""
+        return [_sources[source] for (_, source) in self._pairs()]
+
+    def _trim(self):
+        """Drop the oldest entries beyond ``max_history``."""
+        if self._max_history is not None:
+            excess = len(self._history) - self._max_history + 1
+
+            if excess > 0:
+                self._history = self._history[excess:]
+
+    @property
+    def max_history(self):
+        """Get the maximum number of entries kept."""
+        return self._max_history
+
+    @property
+    def source(self):
+        """Get the current source of the state."""
+        if self._source == _EMPTY:
+            return None
+
+        return _sources[self._source]
 
     @property
     def current(self):
@@ -93,14 +187,34 @@ class State:
 
     def update(self, value, source):
         """Update the current state."""
-        self.values.append(value)
-        self.sources.append(source)
+        if self._source != _EMPTY:
+            self._history = (*self._history, (self._current, self._source))
+            self._trim()
+
         self._current = value
+        self._source = _intern_source(source)
 
     def append(self, other):
         """Append other's history onto self's history."""
         if not isinstance(other, State):
             raise TypeError("other must be a State")
 
-        for v, s in zip(other.values, other.sources):
-            self.update(v, s)
+        if other._source == _EMPTY:
+            return
+
+        self._history = (*self._pairs(), *other._history)
+        self._current = other._current
+        self._source = other._source
+        self._trim()
+
+
+def _unpickle_state(pairs, max_history):
+    """Rebuild a pickled state, interning its sources."""
+    state = State(max_history=max_history)
+
+    if pairs:
+        pairs = tuple((value, _intern_source(source)) for (value, source) in pairs)
+        state._history = pairs[:-1]
+        (state._current, state._source) = pairs[-1]
+
+    return state
@@ -0,0 +1,178 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Configuration loading statistics."""
+
+
+def _shape(values):
+    """Get the key count and maximum depth of an options tree.
+
+    Returns
+    -------
+    tuple
+        The number of keys in all dicts and the maximum nesting depth
+        of dicts and lists, with 0 for a scalar.
+
+    """
+    keys = 0
+    depth = 0
+    stack = [(values, 0)]
+
+    while stack:
+        (node, level) = stack.pop()
+
+        if isinstance(node, dict):
+            keys += len(node)
+            children = node.values()
+        elif isinstance(node, (list, tuple)):
+            children = node
+        else:
+            continue
+
+        depth = max(depth, level + 1)
+        stack.extend((child, level + 1) for child in children)
+
+    return (keys, depth)
+
+
+class ProviderStats:
+    """Load statistics of a provider.
+
+    Attributes
+    ----------
+    name : str
+        Provider name.
+    wall_time : float
+        Seconds spent loading the provider's options.
+    bytes_read : int
+        Bytes read by every loader attempt, for files.
+    attempts : int
+        Loaders tried, for files.
+    failures : int
+        Loaders that failed to read or decode the file, for files.
+    stateful_time : float
+        Seconds spent converting the options to ``State`` objects,
+        or 0 if the previous conversion was reused.
+    merge_time : float
+        Seconds spent merging the provider's options.
+
+    """
+
+    __slots__ = (
+        "_shape",
+        "_values",
+        "attempts",
+        "bytes_read",
+        "failures",
+        "merge_time",
+        "name",
+        "stateful_time",
+        "wall_time",
+    )
+
+    def __init__(self, name):
+        """Initialize empty provider statistics."""
+        self.name = name
+        self.wall_time = 0.0
+        self.bytes_read = 0
+        self.attempts = 0
+        self.failures = 0
+        self.stateful_time = 0.0
+        self.merge_time = 0.0
+        self._values = None
+        self._shape = None
+
+    def __repr__(self):
+        """Reproduce provider statistics."""
+        return f"ProviderStats({self.as_dict()!r})"
+
+    def _set_values(self, values):
+        """Set the loaded options, measured when first needed."""
+        self._values = values
+        self._shape = None
+
+    @property
+    def keys(self):
+        """Get the number of keys in the provider's options."""
+        if self._shape is None:
+            self._shape = _shape(self._values)
+
+        return self._shape[0]
+
+    @property
+    def max_depth(self):
+        """Get the maximum depth of the provider's options."""
+        if self._shape is None:
+            self._shape = _shape(self._values)
+
+        return self._shape[1]
+
+    def as_dict(self):
+        """Get the statistics as a dict."""
+        return {
+            "name": self.name,
+            "wall_time": self.wall_time,
+            "bytes_read": self.bytes_read,
+            "attempts": self.attempts,
+            "failures": self.failures,
+            "keys": self.keys,
+            "max_depth": self.max_depth,
+            "stateful_time": self.stateful_time,
+            "merge_time": self.merge_time,
+        }
+
+
+class LoadStats:
+    """Load statistics of a client configuration.
+
+    Attributes
+    ----------
+    providers : dict
+        ``ProviderStats`` of each loaded provider, in plan order.
+    wall_time : float
+        Seconds spent loading the client configuration.
+    merge_time : float
+        Seconds spent merging all providers, including reusing
+        unchanged values and rebuilding flat maps.
+
+    """
+
+    __slots__ = ("merge_time", "providers", "wall_time")
+
+    def __init__(self):
+        """Initialize empty load statistics."""
+        self.providers = {}
+        self.wall_time = 0.0
+        self.merge_time = 0.0
+
+    def __repr__(self):
+        """Reproduce load statistics."""
+        return f"LoadStats({self.as_dict()!r})"
+
+    def provider(self, name):
+        """Get the statistics of a provider, adding them if new."""
+        stats = self.providers.get(name, None)
+
+        if stats is None:
+            stats = self.providers[name] = ProviderStats(name)
+
+        return stats
+
+    def as_dict(self):
+        """Get the statistics as a dict."""
+        return {
+            "wall_time": self.wall_time,
+            "merge_time": self.merge_time,
+            "providers": {
+                name: stats.as_dict() for (name, stats) in self.providers.items()
+            },
+        }
@@ -10,6 +10,7 @@
 
 """Elective CLI tests."""
 
+import os
 import sys
 
 import pytest
@@ -49,6 +50,81 @@ def test_reset_parser():
     assert cli.parser.description is None
 
 
+def _spell_check_options():
+    """Get a boolean option schema."""
+    options = {}
+    options["spell-check"] = {
+        "providers": [
+            "cli",
+            "env",
+            "file",
+        ],
+        "type": "boolean",
+        "default": False,
+        "action": "store_true",
+        "short": "c",
+        "long": "spell-check",
+        "help": "Spell check.  Default is no spell checking.",
+    }
+
+    return options
+
+
+def test_parser_cache():
+    """Should reuse configured parsers with identical schemas."""
+    elective.CliConfiguration.clear_cache()
+
+    one = elective.CliConfiguration(
+        description="This is a description.",
+        options=_spell_check_options(),
+    )
+    one.config()
+
+    two = elective.CliConfiguration(
+        description="This is a description.",
+        options=_spell_check_options(),
+    )
+    two.config()
+
+    assert two.parser is one.parser
+    two.load(argv=["-c"])
+    assert two.options == {"spell-check": True}
+
+    # Different description.
+    three = elective.CliConfiguration(
+        description="This is another description.",
+        options=_spell_check_options(),
+    )
+    three.config()
+
+    assert three.parser is not one.parser
+
+    # Different schema.
+    options = _spell_check_options()
+    options["spell-check"]["short"] = "s"
+    four = elective.CliConfiguration(
+        description="This is a description.",
+        options=options,
+    )
+    four.config()
+
+    assert four.parser is not one.parser
+    four.load(argv=["-s"])
+    assert four.options == {"spell-check": True}
+
+    # Cache disabled.
+    five = elective.CliConfiguration(
+        description="This is a description.",
+        options=_spell_check_options(),
+        cache=False,
+    )
+    five.config()
+
+    assert five.parser is not one.parser
+
+    elective.CliConfiguration.clear_cache()
+
+
 def test_bad_option(capsys):
     """Should raise and bail on a bad option."""
     # Load CLI options.
@@ -457,3 +533,519 @@ def test_display_option(fs, capsys):
     assert error.type == SystemExit
     assert error.value.code == 0
     assert license in capsys.readouterr().out
+
+
+def _value_cli(kind, **kwargs):
+    """Configure a CLI with one value option of type ``kind``."""
+    options = {}
+    options["value"] = {
+        "providers": ["cli"],
+        "type": kind,
+        "default": None,
+        "short": "v",
+        "long": "value",
+        "help": "A value.",
+        **kwargs,
+    }
+
+    cli = elective.CliConfiguration(
+        description="This is a description.",
+        options=options,
+        cache=False,
+    )
+    cli.config()
+
+    return cli
+
+
+@pytest.mark.parametrize(
+    "kind,arg,expected",
+    (
+        ("path", "~/config", f"{os.path.expanduser('~')}/config"),
+        ("path", "/etc/config", "/etc/config"),
+        ("duration", "90", 90.0),
+        ("duration", "1.5", 1.5),
+        ("duration", "1h30m", 5400.0),
+        ("duration", "2d 4h", 187200.0),
+        ("duration", "1w", 604800.0),
+        ("duration", "250ms", 0.25),
+        ("bytes", "512", 512),
+        ("bytes", "512b", 512),
+        ("bytes", "10K", 10240),
+        ("bytes", "10KiB", 10240),
+        ("bytes", "10kB", 10000),
+        ("bytes", "1.5MiB", 1572864),
+        ("bytes", "2GB", 2000000000),
+        ("dict", "", {}),
+        ("dict", "a=1, b = two", {"a": "1", "b": "two"}),
+        ("dict", "a=x=y", {"a": "x=y"}),
+        ("json", '{"a": [1, 2]}', {"a": [1, 2]}),
+    ),
+)
+def test_registered_value_types(kind, arg, expected):
+    """Should convert registered value types."""
+    cli = _value_cli(kind)
+    cli.load(argv=["--value", arg])
+
+    assert cli.options == {"value": expected}
+
+
+@pytest.mark.parametrize(
+    "kind,arg",
+    (
+        ("duration", "soon"),
+        ("duration", "1y"),
+        ("bytes", "ten"),
+        ("bytes", "10X"),
+        ("dict", "a"),
+        ("dict", "=a"),
+        ("json", "{"),
+    ),
+)
+def test_registered_value_types_invalid(kind, arg, capsys):
+    """Should bail on invalid values of registered types."""
+    cli = _value_cli(kind)
+
+    with pytest.raises(SystemExit) as error:
+        cli.load(argv=["--value", arg])
+
+    assert error.value.code == 2
+    assert "invalid" in capsys.readouterr().err
+
+    # Converter errors are also value errors, without argparse.
+    with pytest.raises(ValueError):
+        elective.cli._value_converters[kind](arg)
+
+
+@pytest.mark.parametrize("kind", ("choices", "enum"))
+def test_choices_option(kind, capsys):
+    """Should load an option restricted to choices."""
+    cli = _value_cli(kind, choices=["red", "green"])
+
+    cli.load(argv=["-v", "red"])
+    assert cli.options == {"value": "red"}
+
+    with pytest.raises(SystemExit) as error:
+        cli.load(argv=["-v", "blue"])
+
+    assert error.value.code == 2
+    assert "invalid choice" in capsys.readouterr().err
+
+
+def test_register_type(monkeypatch):
+    """Should register third party option types."""
+    # Remove the registrations after the test.
+    for name in ("upper", "const"):
+        monkeypatch.setitem(elective.cli._option_types, name, None)
+        monkeypatch.setitem(elective.cli._value_converters, name, None)
+
+    elective.CliConfiguration.register_type(
+        "upper",
+        converter=str.upper,
+        metavar="UPPER",
+    )
+
+    cli = _value_cli("upper")
+    cli.load(argv=["-v", "shout"])
+    assert cli.options == {"value": "SHOUT"}
+
+    def registrar(cli, name, dest, option):
+        cli.parser.add_argument(
+            f"--{name}",
+            dest=dest,
+            action="store_const",
+            const=option["const"],
+        )
+
+    elective.CliConfiguration.register_type("const", registrar=registrar)
+
+    cli = _value_cli("const", const=42)
+    cli.load(argv=["--value"])
+    assert cli.options == {"value": 42}
+    assert "const" not in elective.cli._value_converters
+
+
+def test_register_type_errors():
+    """Should require exactly one of a converter and a registrar."""
+    with pytest.raises(ValueError):
+        elective.CliConfiguration.register_type("nothing")
+
+    with pytest.raises(ValueError):
+        elective.CliConfiguration.register_type(
+            "both",
+            converter=str,
+            registrar=lambda cli, name, dest, option: None,
+        )
+
+
+def _fast_options():
+    """Get a schema of fast path option types."""
+    options = {}
+    options["spell-check"] = {
+        "providers": ["cli"],
+        "type": "boolean_group",
+        "dest": "spell-check",
+        "short_pos": "c",
+        "short_neg": "C",
+        "long_pos": "spell-check",
+        "long_neg": "no-spell-check",
+        "help": "Spell check.",
+    }
+    options["verbose"] = {
+        "providers": ["cli"],
+        "type": "boolean",
+        "default": False,
+        "action": "store_true",
+        "short": "v",
+        "long": "verbose",
+        "help": "Be verbose.",
+    }
+    options["width"] = {
+        "providers": ["cli"],
+        "type": "int",
+        "default": 72,
+        "short": "w",
+        "long": "width",
+        "help": "Width.",
+    }
+    options["ratio"] = {
+        "providers": ["cli"],
+        "type": "float",
+        "default": None,
+        "long": "ratio",
+        "help": "Ratio.",
+    }
+    options["name"] = {
+        "providers": ["cli"],
+        "type": "str",
+        "default": "bob",
+        "short": "n",
+        "long": "name",
+        "help": "Name.",
+    }
+    options["words"] = {
+        "providers": ["cli"],
+        "type": "list",
+        "default": "one,two",
+        "short": "l",
+        "long": "words",
+        "help": "Words.",
+    }
+    options["show-license"] = {
+        "providers": ["cli"],
+        "type": "display",
+        "default": "This is my license.",
+        "help": "Show license.",
+    }
+
+    return options
+
+
+@pytest.mark.parametrize(
+    "argv",
+    (
+        [],
+        ["-c"],
+        ["--no-spell-check", "-v"],
+        ["-c", "--spell-check"],
+        ["-w", "80", "--ratio", "0.5"],
+        ["--width=80", "-w100", "-n", "", "--name", "alice"],
+        ["-l", "", "--words", "a, b,c"],
+        ["-v", "--verbose"],
+        ["-n=alice", "-w=80"],
+        ["-n==alice"],
+        ["-n="],
+        ["-nalice=bob"],
+    ),
+)
+@pytest.mark.parametrize("sparse", (False, True))
+def test_fast_path(argv, sparse):
+    """Should parse simple arguments like argparse, without argparse."""
+    fast = elective.CliConfiguration(
+        options=_fast_options(),
+        cache=False,
+        sparse=sparse,
+    )
+    fast.config()
+    fast.load(argv=argv)
+
+    slow = elective.CliConfiguration(
+        options=_fast_options(),
+        cache=False,
+        fast=False,
+        sparse=sparse,
+    )
+    slow.config()
+    slow.load(argv=argv)
+
+    assert fast._parser is None
+    assert fast.options == slow.options
+
+
+@pytest.mark.parametrize(
+    "argv",
+    (
+        ["-h"],
+        ["--help"],
+        ["--show-license"],
+        ["-c", "-C"],
+        ["-cv"],
+        ["--verb"],
+        ["-w"],
+        ["-w", "wide"],
+        ["-w", "-5"],
+        ["--verbose=1"],
+        ["extra"],
+        ["--"],
+    ),
+)
+def test_fast_path_fallback(argv, capsys):
+    """Should fall back to argparse for anything but simple arguments."""
+    fast = elective.CliConfiguration(options=_fast_options(), cache=False)
+    fast.config()
+
+    slow = elective.CliConfiguration(
+        options=_fast_options(),
+        cache=False,
+        fast=False,
+    )
+    slow.config()
+
+    try:
+        slow.load(argv=argv)
+        expected = (None, slow.options)
+    except SystemExit as error:
+        expected = (error.code, None)
+    slow_output = capsys.readouterr()
+
+    try:
+        fast.load(argv=argv)
+        actual = (None, fast.options)
+    except SystemExit as error:
+        actual = (error.code, None)
+    fast_output = capsys.readouterr()
+
+    assert fast._parser is not None
+    assert actual == expected
+    assert fast_output == slow_output
+
+
+def test_fast_path_unsupported_types():
+    """Should use argparse for option types without fast path support."""
+    cli = _value_cli("duration")
+
+    assert cli._fast is None
+    assert cli._parser is not None
+
+
+def test_display_option_lazy_render(capsys):
+    """Should render display messages only when displayed, once."""
+    options = {}
+    options["show-license"] = {
+        "providers": ["cli"],
+        "type": "display",
+        "default": """
+            This is my license.
+
+            It has two paragraphs.
+        """,
+        "help": "Show license.",
+    }
+
+    elective.cli._render_message.cache_clear()
+
+    cli = elective.CliConfiguration(options=options, fast=False, cache=False)
+    cli.config()
+    cli.load(argv=[])
+
+    assert elective.cli._render_message.cache_info().currsize == 0
+
+    for _ in range(2):
+        with pytest.raises(SystemExit) as error:
+            cli.load(argv=["--show-license"])
+
+        assert error.value.code == 0
+        assert capsys.readouterr().out == (
+            "This is my license.\n\nIt has two paragraphs.\n"
+        )
+
+    info = elective.cli._render_message.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def _command_options():
+    """Get a schema with subcommands."""
+    commands = {
+        "build": {
+            "help": "Build things.",
+            "options": {
+                "jobs": {
+                    "providers": ["cli"],
+                    "type": "int",
+                    "default": 1,
+                    "short": "j",
+                    "long": "jobs",
+                    "help": "Jobs.",
+                },
+            },
+        },
+        "clean": {
+            "help": "Clean things.",
+            "options": {
+                "all": {
+                    "providers": ["cli"],
+                    "type": "boolean",
+                    "default": False,
+                    "short": "a",
+                    "long": "all",
+                    "help": "Clean everything.",
+                },
+            },
+            "commands": {
+                "cache": {
+                    "help": "Clean the cache.",
+                    "options": {},
+                },
+            },
+        },
+    }
+
+    return (_spell_check_options(), commands)
+
+
+@pytest.mark.parametrize("fast", (True, False))
+@pytest.mark.parametrize(
+    "argv,expected",
+    (
+        ([], {"spell-check": False, "command": None}),
+        (["-c"], {"spell-check": True, "command": None}),
+        (
+            ["-c", "build", "-j", "4"],
+            {"spell-check": True, "command": "build", "build": {"jobs": 4}},
+        ),
+        (
+            ["build"],
+            {"spell-check": False, "command": "build", "build": {"jobs": 1}},
+        ),
+        (
+            ["clean", "-a", "cache"],
+            {
+                "spell-check": False,
+                "command": "clean",
+                "clean": {"all": True, "command": "cache", "cache": {}},
+            },
+        ),
+    ),
+)
+def test_commands(fast, argv, expected):
+    """Should load subcommand arguments."""
+    (options, commands) = _command_options()
+
+    cli = elective.CliConfiguration(
+        options=options,
+        commands=commands,
+        fast=fast,
+        cache=False,
+    )
+    cli.config()
+    cli.load(argv=argv)
+
+    assert cli.options == expected
+
+
+def test_commands_lazy(monkeypatch):
+    """Should configure only the selected subcommand."""
+    (options, commands) = _command_options()
+    configured = []
+    config = elective.CliConfiguration.config
+
+    def spy(self):
+        configured.append(self.prog)
+        config(self)
+
+    monkeypatch.setattr(elective.CliConfiguration, "config", spy)
+
+    cli = elective.CliConfiguration(
+        options=options,
+        commands=commands,
+        prog="tool",
+        cache=False,
+    )
+    cli.config()
+    cli.load(argv=["build", "-j", "2"])
+
+    assert configured == ["tool", "tool build"]
+    assert cli._parser is None
+
+
+def test_commands_errors(capsys):
+    """Should bail on unknown subcommands and subcommand arguments."""
+    (options, commands) = _command_options()
+
+    cli = elective.CliConfiguration(
+        options=options,
+        commands=commands,
+        prog="tool",
+        cache=False,
+    )
+    cli.config()
+
+    with pytest.raises(SystemExit) as error:
+        cli.load(argv=["deploy"])
+
+    assert error.value.code == 2
+    assert "invalid choice" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as error:
+        cli.load(argv=["build", "-c"])
+
+    assert error.value.code == 2
+    assert "tool build" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as error:
+        cli.load(argv=["-h"])
+
+    assert error.value.code == 0
+    assert "build: Build things." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("fast", (True, False))
+@pytest.mark.parametrize(
+    "argv,expected",
+    (
+        ([], {}),
+        (["-C"], {"spell-check": False}),
+        (["-w", "80", "-v"], {"width": 80, "verbose": True}),
+    ),
+)
+def test_sparse(fast, argv, expected):
+    """Should load only supplied arguments."""
+    cli = elective.CliConfiguration(
+        options=_fast_options(),
+        fast=fast,
+        sparse=True,
+    )
+    cli.config()
+    cli.load(argv=argv)
+
+    assert cli.options == expected
+
+
+@pytest.mark.parametrize("fast", (True, False))
+def test_sparse_commands(fast):
+    """Should load only supplied subcommand arguments."""
+    (options, commands) = _command_options()
+
+    cli = elective.CliConfiguration(
+        options=options,
+        commands=commands,
+        fast=fast,
+        sparse=True,
+    )
+    cli.config()
+
+    cli.load(argv=[])
+    assert cli.options == {}
+
+    cli.load(argv=["build"])
+    assert cli.options == {"command": "build", "build": {}}
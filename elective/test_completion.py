@@ -0,0 +1,264 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Shell completion tests."""
+
+import shutil
+import subprocess
+
+import pytest
+
+import elective
+
+
+def _schema():
+    """Get an options schema and subcommands."""
+    options = {}
+    options["show-license"] = {
+        "providers": ["cli"],
+        "type": "display",
+        "default": "This is my license.",
+        "help": "Show license.",
+    }
+    options["spell-check"] = {
+        "providers": ["cli", "env", "file"],
+        "type": "boolean_group",
+        "short_pos": "c",
+        "short_neg": "C",
+        "long_pos": "spell-check",
+        "long_neg": "no-spell-check",
+        "help": "Spell check.  Isn't it nice?",
+    }
+    options["color"] = {
+        "providers": ["cli"],
+        "type": "choices",
+        "choices": ["red", "green"],
+        "long": "color",
+        "help": "Color [red or green].",
+    }
+    options["config"] = {
+        "providers": ["cli"],
+        "type": "path",
+        "short": "f",
+        "long": "config",
+        "help": "Configuration file.",
+    }
+    options["secret"] = {
+        "providers": ["env"],
+        "type": "str",
+        "long": "secret",
+        "help": "Not on the command line.",
+    }
+
+    commands = {
+        "build": {
+            "help": "Build things.",
+            "options": {
+                "jobs": {
+                    "providers": ["cli"],
+                    "type": "int",
+                    "short": "j",
+                    "long": "jobs",
+                    "help": "Jobs.",
+                },
+            },
+            "commands": {},
+        },
+        "clean": {
+            "help": "Clean things.",
+            "options": {},
+            "commands": {
+                "cache": {
+                    "help": "Clean the cache.",
+                    "options": {},
+                    "commands": {},
+                },
+            },
+        },
+    }
+
+    return (options, commands)
+
+
+def test__bash_completion():
+    """Should generate a bash completion script."""
+    (options, commands) = _schema()
+    script = elective._bash_completion("my-tool", options, commands)
+
+    assert "complete -F _my_tool my-tool" in script
+    assert '"/build"|"/clean"|"/clean/cache")' in script
+    assert (
+        'opts="-h --help --show-license -c --spell-check -C --no-spell-check'
+        ' --color -f --config build clean" ;;'
+    ) in script
+    assert (
+        "--color) COMPREPLY=(); while IFS= read -r word;"
+        ' do COMPREPLY+=("$word"); done'
+        " < <(compgen -W 'red green' -- \"$cur\"); return ;;"
+    ) in script
+    assert '-f|--config) COMPREPLY=($(compgen -f -- "$cur")); return ;;' in script
+    assert "-j|--jobs) COMPREPLY=(); return ;;" in script
+    assert '            opts="-h --help cache" ;;' in script
+    assert "--secret" not in script
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="requires bash")
+def test__bash_completion_runs():
+    """Should complete in bash."""
+    (options, commands) = _schema()
+    script = elective._bash_completion("tool", options, commands)
+
+    def complete(*words):
+        """Complete the last word of ``words``."""
+        test = (
+            f"{script}\n"
+            f"COMP_WORDS=(tool {' '.join(words)})\n"
+            f"COMP_CWORD={len(words)}\n"
+            "_tool\n"
+            'echo "${COMPREPLY[@]}"\n'
+        )
+        result = subprocess.run(  # noqa: S603
+            ["bash", "-c", test],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        return result.stdout.split()
+
+    assert complete("--sp") == ["--spell-check"]
+    assert complete("--color", "") == ["red", "green"]
+    assert complete("b") == ["build"]
+    assert complete("build", "-") == ["-h", "--help", "-j", "--jobs"]
+    assert complete("clean", "") == ["-h", "--help", "cache"]
+    assert complete("clean", "cache", "-") == ["-h", "--help"]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="requires bash")
+def test__bash_completion_special_choices(tmp_path):
+    """Should complete choices with shell special characters literally."""
+    marker = tmp_path / "expanded"
+    choices = ["it's", f"$(touch {marker})", "`id`", '"q"', "$HOME", "*", "a\\b"]
+    options = {
+        "color": {
+            "providers": ["cli"],
+            "type": "choices",
+            "choices": choices,
+            "long": "color",
+            "help": "Color.",
+        },
+    }
+    script = elective._bash_completion("tool", options)
+    test = (
+        f"{script}\n"
+        "COMP_WORDS=(tool --color '')\n"
+        "COMP_CWORD=2\n"
+        "_tool\n"
+        'printf "%s\\n" "${COMPREPLY[@]}"\n'
+    )
+    result = subprocess.run(  # noqa: S603
+        ["bash", "-c", test],  # noqa: S607
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == choices
+    assert not marker.exists()
+
+
+def test__zsh_completion():
+    """Should generate a zsh completion script."""
+    (options, commands) = _schema()
+    script = elective._zsh_completion("tool", options, commands)
+
+    assert script.startswith("#compdef tool\n")
+    assert "{-h,--help}'[show this help message and exit]'" in script
+    assert (
+        "'(-c --spell-check -C --no-spell-check)'{-c,--spell-check}"
+        "'[Spell check.  Isn'\\''t it nice?]'"
+    ) in script
+    assert "'(--color)'--color'[Color \\[red or green\\].]:value:(red green)'" in (
+        script
+    )
+    assert "{-f,--config}'[Configuration file.]:path:_files'" in script
+    assert (
+        '\'1:command:((build\\:"Build things." clean\\:"Clean things."))\''
+    ) in script
+    assert '"/clean/cache")' in script
+    assert '_tool "$@"' in script
+
+
+def test__fish_completion():
+    """Should generate a fish completion script."""
+    (options, commands) = _schema()
+    script = elective._fish_completion("tool", options, commands)
+    top = "-n 'not __fish_seen_subcommand_from build clean cache'"
+
+    assert script.startswith("complete -c tool -f\n")
+    assert f"complete -c tool {top} -s c -l spell-check" in script
+    assert "-d 'Spell check.  Isn\\'t it nice?'" in script
+    assert f"complete -c tool {top} -l color -x -a 'red green'" in script
+    assert f"complete -c tool {top} -s f -l config -r -F" in script
+    assert (
+        "complete -c tool -n 'not __fish_seen_subcommand_from build clean'"
+        " -a build -d 'Build things.'"
+    ) in script
+    assert (
+        "complete -c tool -n '__fish_seen_subcommand_from clean;"
+        " and not __fish_seen_subcommand_from cache' -a cache"
+    ) in script
+    assert (
+        "complete -c tool -n '__fish_seen_subcommand_from build' -s j -l jobs -x"
+    ) in script
+
+
+def test_elective_config_completion(fs):
+    """Should generate completion scripts for a configuration."""
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+
+[elective.options.spell-check]
+
+providers = [
+  "cli",
+]
+type = "boolean_group"
+default = false
+short_pos = "c"
+short_neg = "C"
+long_pos = "spell-check"
+long_neg = "no-spell-check"
+help = "Spell check."
+"""
+        )
+
+    conf = elective.ElectiveConfig()
+
+    with pytest.raises(ValueError):
+        conf.completion("bash")
+
+    conf.load_elective_config(fn)
+
+    assert "complete -F _client client" in conf.completion("bash")
+    assert "#compdef client" in conf.completion("zsh")
+    assert "complete -c client -s c -l spell-check" in conf.completion("fish")
+
+    with pytest.raises(ValueError) as error:
+        conf.completion("tcsh")
+
+    assert "tcsh" in str(error.value)
@@ -10,6 +10,9 @@
 
 """Elective config tests."""
 
+import concurrent.futures
+import json
+import os
 import types
 
 import pytest
@@ -385,6 +388,26 @@ def test__process_single_option_extra_is_ignored():
     assert hasattr(cleaned, "yourface") is False
 
 
+def test__process_single_option_optional_keys():
+    """Should keep optional keys only when present."""
+    options = {
+        "type": "choices",
+        "providers": ["cli"],
+        "default": "red",
+        "short": "c",
+        "long": "color",
+        "choices": ["red", "green"],
+    }
+
+    cleaned = elective.ElectiveConfig._process_single_option(options)
+
+    assert cleaned["short"] == "c"
+    assert cleaned["long"] == "color"
+    assert cleaned["choices"] == ["red", "green"]
+    assert "action" not in cleaned
+    assert "merge" not in cleaned
+
+
 def test__process_option_one_idempotent():
     """Should return the same dictionary."""
     options = {
@@ -602,75 +625,1350 @@ help = "Wrap lines.  Default is no line wrapping."
             "type": "display",
             "default": """elective:  a Python configuration loader generator.
 
-Copyright 2021-2022 Jeremy A Gray <gray@flyquackswim.com>.
+Copyright 2021-2022 Jeremy A Gray <gray@flyquackswim.com>.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+""",
+            "help": "Show warranty.",
+            "short_neg": None,
+            "long_neg": None,
+            "short_pos": None,
+            "long_pos": None,
+            "dest": None,
+        },
+        "show-license": {
+            "providers": [
+                "cli",
+            ],
+            "type": "display",
+            "default": """elective:  a Python configuration loader generator.
+
+Copyright 2021-2022 Jeremy A Gray <gray@flyquackswim.com>.
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+""",
+            "help": "Show license.",
+            "short_neg": None,
+            "long_neg": None,
+            "short_pos": None,
+            "long_pos": None,
+            "dest": None,
+        },
+    }
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+
+    assert "line-wrap" in conf.options
+    assert conf.options["line-wrap"] == options["line-wrap"]
+    assert "spell-check" in conf.options
+    assert conf.options["spell-check"] == options["spell-check"]
+    assert "show-license" in conf.options
+    assert conf.options["show-license"] == options["show-license"]
+    assert "show-warranty" in conf.options
+    assert conf.options["show-warranty"] == options["show-warranty"]
+
+
+def test_elective_config_load_merge(fs):
+    """Should correctly merge options."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+description = "This is a description."
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "yaml",
+  "bespon",
+  "env",
+  "cli",
+]
+
+[elective.options]
+
+[elective.options.spell-check]
+
+providers = [
+  "cli",
+  "env",
+  "file",
+]
+type = "boolean_group"
+default = false
+short_pos = "c"
+short_neg = "C"
+long_pos = "spell-check"
+long_neg = "no-spell-check"
+dest = "spell-check"
+help = "Spell check.  Default is no spell checking."
+
+[elective.options.line-wrap]
+
+providers = [
+  "cli",
+  "env",
+  "file",
+]
+type = "boolean_group"
+default = false
+short_pos = "w"
+short_neg = "W"
+long_pos = "wrap"
+long_neg = "no-wrap"
+dest = "line-wrap"
+help = "Wrap lines.  Default is no line wrapping."
+"""
+        )
+
+    # Create a TOML configuration file.
+    toml_fn = ".client.toml"
+    fs.create_file(toml_fn)
+    with open(toml_fn, "w") as f:
+        f.write(
+            """[client]
+spell-check = true
+"""
+        )
+
+    # Create a JSON configuration file.
+    json_fn = ".client.json"
+    fs.create_file(json_fn)
+    with open(json_fn, "w") as f:
+        f.write(
+            """{ "client": {
+    "spell-check": true
+  }
+}
+"""
+        )
+
+    # Left merge.
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=[])
+
+    assert "line-wrap" in conf.config
+    assert conf.config["line-wrap"] == elective.State((False, "default"))
+
+    assert "spell-check" in conf.config
+    assert conf.config["spell-check"] == elective.State((True, "json"))
+
+    # Right merge.
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.elective["combine"] = "right"
+    conf.load_client_config(argv=[])
+
+    assert "line-wrap" in conf.config
+    assert conf.config["line-wrap"] == elective.State((False, "default"))
+
+    assert "spell-check" in conf.config
+    assert conf.config["spell-check"] == elective.State((False, "default"))
+
+    # No merge; use last.
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.elective["combine"] = None
+    conf.load_client_config(argv=[])
+
+    assert "line-wrap" in conf.config
+    assert conf.config["line-wrap"] == elective.State((None, "cli"))
+
+    assert "spell-check" in conf.config
+    assert conf.config["spell-check"] == elective.State((None, "cli"))
+
+    # No merge with non-existing format.
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.elective["combine"] = None
+    conf.elective["order"].append("unknown")
+    conf.load_client_config(argv=[])
+
+    assert "line-wrap" in conf.config
+    assert conf.config["line-wrap"] == elective.State((None, "cli"))
+
+    assert "spell-check" in conf.config
+    assert conf.config["spell-check"] == elective.State((None, "cli"))
+
+
+def test_elective_config_load_first_provider(fs, monkeypatch):
+    """Should load only the highest precedence provider with options."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+sparse = true
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "env",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "env",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    loaded = []
+    load_file = elective.ElectiveConfig._load_file
+
+    def _spy(self, fmt):
+        loaded.append(fmt)
+        return load_file(self, fmt)
+
+    monkeypatch.setattr(elective.ElectiveConfig, "_load_file", _spy)
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+
+    # CLI options win; nothing else is loaded.
+    conf.load_client_config(argv=["-w", "100"])
+
+    assert conf.config == {"width": elective.State((100, "cli"))}
+    assert loaded == []
+
+    # Empty CLI and environment; stop at the first file with options.
+    conf.load_client_config(argv=[])
+
+    assert conf.config == {"width": elective.State((80, "toml"))}
+    assert conf.config["width"].values == [80]
+    assert loaded == ["json", "toml"]
+
+    # Environment options win over files.
+    loaded.clear()
+    monkeypatch.setenv("ELECTIVE_CLIENT_WIDTH", "90")
+    conf.load_client_config(argv=[])
+
+    assert conf.config == {"width": elective.State((90, "env"))}
+    assert loaded == []
+
+    # Order is unchanged.
+    assert conf.elective["order"][-1] == "cli"
+
+
+def test_elective_config_load_order_providers(fs, monkeypatch):
+    """Should load only the providers named in ``order``."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "env",
+]
+
+[elective.options.width]
+
+providers = [
+  "env",
+]
+type = "int"
+default = 72
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("provider should not be loaded")
+
+    monkeypatch.setattr(elective.ElectiveConfig, "_load_cli", _fail)
+    monkeypatch.setattr(elective.ElectiveConfig, "_load_file", _fail)
+    monkeypatch.setenv("ELECTIVE_CLIENT_WIDTH", "90")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=["--unknown"])
+
+    assert conf.config == {"width": elective.State((90, "env"))}
+    assert conf.config["width"].values == [72, 90]
+
+
+def test_elective_config_load_drops_providers(fs, monkeypatch):
+    """Should drop options set by providers they do not allow."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "env",
+]
+
+[elective.options.width]
+
+providers = [
+  "env",
+]
+type = "int"
+default = 72
+help = "Width."
+
+[elective.options.tabs]
+
+providers = [
+  "toml",
+]
+type = "int"
+default = 8
+help = "Tabs."
+
+[elective.options.wrap]
+
+providers = [
+  "file",
+]
+type = "boolean"
+default = false
+help = "Wrap."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\ntabs = 4\nwrap = true\nextra = 1\n")
+
+    with open(".client.json", "w") as f:
+        f.write('{"client": {"tabs": 2}}\n')
+
+    monkeypatch.setenv("ELECTIVE_CLIENT_TABS", "1")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=[])
+
+    assert conf.config["width"] == elective.State((72, "default"))
+    assert conf.config["tabs"] == elective.State((4, "toml"))
+    assert conf.config["tabs"].values == [8, 4]
+    assert conf.config["wrap"] == elective.State((True, "toml"))
+    assert conf.config["extra"] == elective.State((1, "toml"))
+
+
+def test_elective_config_load_plan(fs):
+    """Should compile the precedence plan once, without changing ``order``."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "right"
+
+order = [
+  "defaults",
+  "toml",
+  "unknown",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "file",
+]
+type = "int"
+default = 72
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    plan = conf._plan
+
+    assert plan.providers == ("cli", "toml", "defaults")
+    assert plan.sources["defaults"] == "default"
+
+    with pytest.raises(AttributeError):
+        plan.providers = ()
+
+    with pytest.raises(TypeError):
+        plan.drops["cli"] = frozenset()
+
+    # Repeated loads use the same plan and order.
+    for _ in range(3):
+        conf.load_client_config(argv=[])
+
+        assert conf.config["width"] == elective.State((72, "default"))
+        assert conf.config["width"].values == [80, 72]
+        assert conf._plan is plan
+        assert conf.elective["order"] == ["defaults", "toml", "unknown", "cli"]
+
+    # Changing the combine mode recompiles the plan.
+    conf.elective["combine"] = "left"
+    conf.load_client_config(argv=[])
+
+    assert conf._plan is not plan
+    assert conf._plan.providers == ("defaults", "toml", "cli")
+    assert conf.config["width"] == elective.State((80, "toml"))
+
+
+def test_elective_config_load_executor(fs, monkeypatch):
+    """Should load providers on an executor and merge in order."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "env",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "env",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    with open(".client.json", "w") as f:
+        f.write('{"client": {"width": 90}}\n')
+
+    monkeypatch.setenv("ELECTIVE_CLIENT_WIDTH", "95")
+
+    serial = elective.ElectiveConfig()
+    serial.load_elective_config(fn)
+    serial.load_client_config(argv=["-w", "100"])
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        submitted = []
+        submit = executor.submit
+
+        def _spy(fn, *args):
+            submitted.append(args[1])
+            return submit(fn, *args)
+
+        monkeypatch.setattr(executor, "submit", _spy)
+
+        conf = elective.ElectiveConfig()
+        conf.load_elective_config(fn)
+        conf.load_client_config(argv=["-w", "100"], executor=executor)
+
+        assert submitted == ["defaults", "toml", "json", "env", "cli"]
+        assert conf.config == serial.config
+        assert conf.config["width"].values == serial.config["width"].values
+        assert conf.config["width"].sources == [
+            "default",
+            "toml",
+            "json",
+            "env",
+            "cli",
+        ]
+
+        # Errors are raised from the executor.
+        conf.executor = executor
+        with pytest.raises(SystemExit):
+            conf.load_client_config(argv=["-w", "wide"])
+
+
+def test_elective_config_load_tracer(fs):
+    """Should trace the phases of loading."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    sink = elective.MemorySink()
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.tracer = elective.Tracer(sinks=[sink])
+    conf.load_client_config(argv=["-w", "100"])
+
+    events = [(event["name"], event["attrs"].get("provider", None)) for event in sink]
+
+    assert events == [
+        ("parse", "defaults"),
+        ("file_loader", None),
+        ("bytes_read", "toml"),
+        ("parse", "toml"),
+        ("parse", "cli"),
+        ("stateful", "defaults"),
+        ("stateful", "toml"),
+        ("stateful", "cli"),
+        ("merge_step", "defaults"),
+        ("merge_step", "toml"),
+        ("merge_step", "cli"),
+        ("merge", None),
+        ("load_client_config", None),
+    ]
+    assert sink[1]["attrs"] == {"fn": ".client.toml", "loader": "_toml_file_loader"}
+    assert sink[2]["value"] == 20
+    assert sink[3]["attrs"]["keys"] == 1
+    assert sink[11]["attrs"] == {"backend": "state", "keys": 1, "affected": 1}
+    assert sink[12]["attrs"] == {"combine": "left", "backend": "state"}
+
+    # Unchanged providers are not converted again.
+    sink.clear()
+    conf.load_client_config(argv=["-w", "100"])
+
+    assert [event["name"] for event in sink if event["type"] == "span"] == [
+        "parse",
+        "file_loader",
+        "parse",
+        "parse",
+        "merge_step",
+        "merge_step",
+        "merge_step",
+        "merge",
+        "load_client_config",
+    ]
+
+
+@pytest.mark.parametrize("backend", ["state", "columnar"])
+def test_elective_config_load_stats(fs, backend):
+    """Should expose the load statistics of each provider."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n[client.sub]\ndepth = 2\n")
+
+    with open(".client.json", "w") as f:
+        f.write("[client\n")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.elective["backend"] = backend
+
+    assert conf.stats is None
+
+    conf.load_client_config(argv=["-w", "100"])
+    stats = conf.stats
+
+    assert list(stats.providers) == ["defaults", "toml", "json", "cli"]
+    assert stats.wall_time >= stats.merge_time > 0
+
+    toml = stats.providers["toml"]
+
+    assert toml.bytes_read == 43
+    assert toml.attempts == 1
+    assert toml.failures == 0
+    assert toml.keys == 3
+    assert toml.max_depth == 2
+    assert toml.wall_time > 0
+    assert toml.merge_time > 0
+
+    json = stats.providers["json"]
+
+    assert json.bytes_read == 4 * 8
+    assert json.attempts == 4
+    assert json.failures == 4
+    assert json.keys == 0
+    assert json.merge_time == 0
+
+    assert stats.providers["cli"].keys == 1
+    assert stats.providers["cli"].bytes_read == 0
+
+    # Statistics are replaced by each load.
+    conf.load_client_config(argv=["-w", "100"])
+
+    assert conf.stats is not stats
+
+
+def test_elective_config_chrome_trace(fs, monkeypatch):
+    """Should write a Chrome trace of every load to ``ELECTIVE_TRACE``."""
+    monkeypatch.setattr(elective.tracing, "_chrome_sinks", {})
+    monkeypatch.setenv("ELECTIVE_TRACE", "trace.json")
+
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+
+    with open("trace.json") as f:
+        names = [event["name"] for event in json.load(f)["traceEvents"]]
+
+    assert names == ["file_loader", "stateful", "load_elective_config"]
+
+    conf.load_client_config(argv=["-w", "100"])
+
+    with open("trace.json") as f:
+        events = json.load(f)["traceEvents"]
+
+    assert [event["name"] for event in events if event["ph"] == "X"][3:] == [
+        "parse",
+        "file_loader",
+        "parse",
+        "parse",
+        "stateful",
+        "stateful",
+        "stateful",
+        "merge_step",
+        "merge_step",
+        "merge_step",
+        "merge",
+        "load_client_config",
+    ]
+    assert conf.config["width"].current == 100
+
+    # Other configurations append to the same trace.
+    elective.ElectiveConfig().load_elective_config(fn)
+
+    with open("trace.json") as f:
+        names = [event["name"] for event in json.load(f)["traceEvents"]]
+
+    assert len(names) == len(events) + 3
+    assert names[-1] == "load_elective_config"
+
+
+def test_elective_config_load_merge_env(fs, monkeypatch):
+    """Should merge typed environment options."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "toml",
+  "env",
+  "cli",
+]
+
+[elective.options]
+
+[elective.options.spell-check]
+
+providers = [
+  "cli",
+  "env",
+  "file",
+]
+type = "boolean_group"
+default = false
+short_pos = "c"
+short_neg = "C"
+long_pos = "spell-check"
+long_neg = "no-spell-check"
+dest = "spell-check"
+help = "Spell check.  Default is no spell checking."
+
+[elective.options.width]
+
+providers = [
+  "env",
+  "file",
+]
+type = "int"
+default = 72
+help = "Line width."
+"""
+        )
+
+    # Create a TOML configuration file.
+    toml_fn = ".client.toml"
+    fs.create_file(toml_fn)
+    with open(toml_fn, "w") as f:
+        f.write(
+            """[client]
+width = 80
+"""
+        )
+
+    monkeypatch.setenv("ELECTIVE_CLIENT_SPELL_CHECK", "true")
+    monkeypatch.setenv("ELECTIVE_CLIENT_WIDTH", "80")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=[])
+
+    assert conf.config["spell-check"] == elective.State((True, "env"))
+    assert conf.config["width"] == elective.State((80, "env"))
+    assert conf.config["width"].values == [72, 80, 80]
+
+
+def test_elective_config_load_commands(fs):
+    """Should load subcommand options from the command line."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+
+order = [
+  "defaults",
+  "cli",
+]
+
+[elective.options]
+
+[elective.commands.build]
+
+help = "Build things."
+
+[elective.commands.build.options.jobs]
+
+providers = [
+  "cli",
+]
+type = "int"
+default = 1
+short = "j"
+long = "jobs"
+help = "Jobs."
+"""
+        )
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+
+    assert conf.commands["build"]["help"] == "Build things."
+    assert conf.commands["build"]["options"]["jobs"]["type"] == "int"
+    assert conf.commands["build"]["commands"] == {}
+
+    conf.load_client_config(argv=["build", "-j", "3"])
+
+    assert conf.config["command"] == elective.State(("build", "cli"))
+    assert conf.config["build"]["jobs"] == elective.State((3, "cli"))
+
+
+def test_elective_config_load_sparse(fs):
+    """Should merge only supplied command line arguments."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+sparse = true
+
+order = [
+  "defaults",
+  "cli",
+]
+
+[elective.options.spell-check]
+
+providers = [
+  "cli",
+]
+type = "boolean_group"
+default = false
+short_pos = "c"
+short_neg = "C"
+long_pos = "spell-check"
+long_neg = "no-spell-check"
+dest = "spell-check"
+help = "Spell check."
+
+[elective.options.line-wrap]
+
+providers = [
+  "cli",
+]
+type = "boolean_group"
+default = false
+short_pos = "w"
+short_neg = "W"
+long_pos = "wrap"
+long_neg = "no-wrap"
+dest = "line-wrap"
+help = "Wrap lines."
+"""
+        )
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=["-c"])
+
+    assert conf.elective["sparse"] is True
+    assert conf.config["spell-check"] == elective.State((True, "cli"))
+    assert conf.config["spell-check"].sources == ["default", "cli"]
+    assert conf.config["line-wrap"] == elective.State((False, "default"))
+    assert conf.config["line-wrap"].sources == ["default"]
+
+
+def test_elective_config_load_max_history(fs):
+    """Should bound the history of merged values."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+max_history = 2
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\n")
+
+    with open(".client.json", "w") as f:
+        f.write('{"client": {"width": 90}}\n')
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=["-w", "100"])
+
+    assert conf.config["width"] == elective.State((100, "cli"))
+    assert conf.config["width"].values == [90, 100]
+    assert conf.config["width"].sources == ["json", "cli"]
+
+
+@pytest.mark.parametrize("combine", ["left", "right", None])
+def test_elective_config_load_columnar(fs, combine):
+    """Should combine options in a columnar store like ``State``."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+
+[elective.options.tags]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "list"
+default = []
+short = "t"
+long = "tags"
+help = "Tags."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write('[client]\nwidth = 80\ntags = ["a"]\n')
+
+    with open(".client.json", "w") as f:
+        f.write('{"client": {"width": 90, "tags": ["b"]}}\n')
+
+    configs = {}
+    for backend in ("state", "columnar"):
+        conf = elective.ElectiveConfig()
+        conf.load_elective_config(fn)
+        conf.elective["combine"] = combine
+        conf.elective["backend"] = backend
+        conf.load_client_config(argv=["-w", "100", "-t", "c"])
+        configs[backend] = conf
+
+    state = configs["state"].config
+    columnar = configs["columnar"].config
+
+    assert configs["state"].provenance is None
+    assert list(columnar) == list(state)
+    assert columnar == state
+
+    for k, v in state.items():
+        if isinstance(v, elective.State):
+            assert columnar[k].values == v.values
+            assert columnar[k].sources == v.sources
+
+
+def test_elective_config_load_backend_exception(fs):
+    """Should raise a ``ValueError`` for an unknown backend."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+backend = "rows"
+"""
+        )
+
+    conf = elective.ElectiveConfig()
+
+    with pytest.raises(ValueError):
+        conf.load_elective_config(fn)
+
+
+@pytest.mark.parametrize("merge", ["tree", "flat"])
+def test_elective_config_load_incremental(fs, merge):
+    """Should re-merge only the keys touched by changed providers."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+combine = "left"
+sparse = true
+
+order = [
+  "defaults",
+  "toml",
+  "json",
+  "cli",
+]
+
+[elective.options.width]
+
+providers = [
+  "cli",
+  "file",
+]
+type = "int"
+default = 72
+short = "w"
+long = "width"
+help = "Width."
+
+[elective.options.tabs]
+
+providers = [
+  "file",
+]
+type = "int"
+default = 8
+help = "Tabs."
+"""
+        )
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\nwidth = 80\ntabs = 4\n")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.elective["merge"] = merge
+    conf.load_client_config(argv=[])
+    first = conf.config
+    merged = conf._merged[1]
+
+    assert first["width"] == elective.State((80, "toml"))
+    assert first["tabs"] == elective.State((4, "toml"))
+
+    # Only JSON changes; the untouched key is reused.
+    with open(".client.json", "w") as f:
+        f.write('{"client": {"tabs": 2}}\n')
+
+    conf.load_client_config(argv=[])
+
+    assert conf.config is not first
+    assert conf._merged[1]["width"] is merged["width"]
+    assert conf.config["width"] is not first["width"]
+    assert conf.config["width"] == first["width"]
+    assert conf.config["tabs"] == elective.State((2, "json"))
+    assert conf.config["tabs"].values == [8, 4, 2]
+    assert first["tabs"] == elective.State((4, "toml"))
+
+    # The incremental merge matches a full merge.
+    fresh = elective.ElectiveConfig()
+    fresh.load_elective_config(fn)
+    fresh.elective["merge"] = "tree"
+    fresh.load_client_config(argv=["-w", "100"])
+    conf.load_client_config(argv=["-w", "100"])
+
+    assert conf.config == fresh.config
+    assert list(conf.config) == list(fresh.config)
+    assert conf.config["width"] == elective.State((100, "cli"))
+    assert conf.config["width"].values == fresh.config["width"].values
+
+    # A removed provider is re-merged.
+    os.remove(".client.json")
+    conf.load_client_config(argv=["-w", "100"])
+
+    assert conf.config["tabs"] == elective.State((4, "toml"))
+    assert conf.config["tabs"].values == [8, 4]
+
+
+def test_elective_config_load_failed_reload(fs):
+    """Should merge every provider again after a failed load."""
+    fn = "config.toml"
+    fs.create_file(
+        fn,
+        contents="""[elective]
+
+name = "client"
+combine = "left"
+sparse = true
+order = ["defaults", "toml"]
+
+[elective.options.a]
+
+providers = ["file"]
+type = "list"
+default = [1]
+help = "A."
+""",
+    )
+    fs.create_file(".client.toml", contents="[client]\na = [2]\n")
+
+    conf = elective.ElectiveConfig()
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=[])
+
+    assert [state.current for state in conf.config["a"]] == [1, 2]
+
+    with open(".client.toml", "w") as f:
+        f.write("[client.a]\nx = 1\n")
+
+    # Fail on the change and on every unchanged reload.
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            conf.load_client_config(argv=[])
+
+    with open(".client.toml", "w") as f:
+        f.write("[client]\na = [3]\n")
+
+    conf.load_client_config(argv=[])
+
+    assert [state.current for state in conf.config["a"]] == [1, 3]
 
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
-EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
-MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
-NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
-LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
-OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
-WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-""",
-            "help": "Show warranty.",
-            "short_neg": None,
-            "long_neg": None,
-            "short_pos": None,
-            "long_pos": None,
-            "dest": None,
-        },
-        "show-license": {
-            "providers": [
-                "cli",
-            ],
-            "type": "display",
-            "default": """elective:  a Python configuration loader generator.
 
-Copyright 2021-2022 Jeremy A Gray <gray@flyquackswim.com>.
+def test_elective_config_load_copies_states(fs):
+    """Should not share the exposed states with later loads."""
+    fn = "config.toml"
+    fs.create_file(
+        fn,
+        contents="""[elective]
 
-Permission is hereby granted, free of charge, to any person obtaining
-a copy of this software and associated documentation files (the
-"Software"), to deal in the Software without restriction, including
-without limitation the rights to use, copy, modify, merge, publish,
-distribute, sublicense, and/or sell copies of the Software, and to
-permit persons to whom the Software is furnished to do so, subject to
-the following conditions:
+name = "client"
+combine = "left"
+sparse = true
+order = ["defaults", "toml"]
 
-The above copyright notice and this permission notice shall be
-included in all copies or substantial portions of the Software.
+[elective.options.a]
 
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
-EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
-MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
-NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
-LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
-OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
-WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+providers = ["file"]
+type = "int"
+default = 1
+help = "A."
+
+[elective.options.b]
+
+providers = ["file"]
+type = "list"
+default = [1]
+help = "B."
 """,
-            "help": "Show license.",
-            "short_neg": None,
-            "long_neg": None,
-            "short_pos": None,
-            "long_pos": None,
-            "dest": None,
-        },
-    }
+    )
+    fs.create_file(".client.toml", contents="[client]\nb = [2]\n")
 
     conf = elective.ElectiveConfig()
     conf.load_elective_config(fn)
+    conf.load_client_config(argv=[])
 
-    assert "line-wrap" in conf.options
-    assert conf.options["line-wrap"] == options["line-wrap"]
-    assert "spell-check" in conf.options
-    assert conf.options["spell-check"] == options["spell-check"]
-    assert "show-license" in conf.options
-    assert conf.options["show-license"] == options["show-license"]
-    assert "show-warranty" in conf.options
-    assert conf.options["show-warranty"] == options["show-warranty"]
+    conf.config["a"].update(99, "runtime")
+    conf.config["b"][1].update(99, "runtime")
+    conf.config["b"].append(elective.State((99, "runtime")))
+    conf.load_client_config(argv=[])
 
+    assert conf.config["a"] == elective.State((1, "default"))
+    assert conf.config["a"].values == [1]
+    assert [state.current for state in conf.config["b"]] == [1, 2]
+    assert conf.config["b"][1].sources == ["toml"]
 
-def test_elective_config_load_merge(fs):
-    """Should correctly merge options."""
+
+def test_elective_config_reload_elective_config(fs):
+    """Should use the defaults of a reloaded elective configuration."""
+    fn = "config.toml"
+    schema = """[elective]
+
+name = "client"
+combine = "left"
+sparse = true
+order = ["defaults", "cli"]
+{options}
+"""
+    option = """
+[elective.options.width]
+
+providers = ["cli"]
+type = "int"
+default = {default}
+long = "width"
+help = "Width."
+"""
+
+    conf = elective.ElectiveConfig()
+
+    for default in (1, 2):
+        fs.create_file(
+            fn, contents=schema.format(options=option.format(default=default))
+        )
+        conf.load_elective_config(fn)
+        conf.load_client_config(argv=[])
+        fs.remove(fn)
+
+        assert conf.config["width"] == elective.State((default, "default"))
+
+    fs.create_file(fn, contents=schema.format(options="[elective.options]\n"))
+    conf.load_elective_config(fn)
+    conf.load_client_config(argv=[])
+
+    assert "width" not in conf.config
+
+
+@pytest.mark.parametrize(
+    "left,right,expected",
+    [
+        ({"one": 1}, {"one": 1}, True),
+        ({"one": 1}, {"one": True}, False),
+        ({"one": 1.0}, {"one": 1}, False),
+        ({"one": [1, 2]}, {"one": [1, 2]}, True),
+        ({"one": [1, 2]}, {"one": [1]}, False),
+        ({"one": 1, "two": 2}, {"two": 2, "one": 1}, False),
+        ({"one": float("nan")}, {"one": float("nan")}, True),
+        ({"one": {"two": None}}, {"one": {"two": None}}, True),
+    ],
+)
+def test__same(left, right, expected):
+    """Should compare raw option trees by value and type."""
+    assert elective.elective._same(left, right) is expected
+
+
+def test_elective_config_load_merge_exception(fs):
+    """Should raise a ``ValueError`` for an unknown merge engine."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            """[elective]
+
+name = "client"
+merge = "graph"
+"""
+        )
+
+    conf = elective.ElectiveConfig()
+
+    with pytest.raises(ValueError):
+        conf.load_elective_config(fn)
+
+
+def test_elective_config_load_merge_strategies(fs):
+    """Should merge list options with their strategies."""
     # Create an elective configuration file.
     fn = "config.toml"
     fs.create_file(fn)
@@ -678,125 +1976,106 @@ def test_elective_config_load_merge(fs):
         f.write(
             """[elective]
 
-description = "This is a description."
 name = "client"
 combine = "left"
+sparse = true
 
 order = [
   "defaults",
   "toml",
   "json",
-  "yaml",
-  "bespon",
-  "env",
   "cli",
 ]
 
-[elective.options]
-
-[elective.options.spell-check]
+[elective.options.tags]
 
 providers = [
   "cli",
-  "env",
   "file",
 ]
-type = "boolean_group"
-default = false
-short_pos = "c"
-short_neg = "C"
-long_pos = "spell-check"
-long_neg = "no-spell-check"
-dest = "spell-check"
-help = "Spell check.  Default is no spell checking."
+type = "list"
+default = ["a"]
+short = "t"
+long = "tags"
+help = "Tags."
+merge = "union"
 
-[elective.options.line-wrap]
+[elective.options.paths]
 
 providers = [
   "cli",
-  "env",
   "file",
 ]
-type = "boolean_group"
-default = false
-short_pos = "w"
-short_neg = "W"
-long_pos = "wrap"
-long_neg = "no-wrap"
-dest = "line-wrap"
-help = "Wrap lines.  Default is no line wrapping."
+type = "list"
+default = ["/usr"]
+short = "p"
+long = "paths"
+help = "Paths."
+merge = "replace"
 """
         )
 
-    # Create a TOML configuration file.
-    toml_fn = ".client.toml"
-    fs.create_file(toml_fn)
-    with open(toml_fn, "w") as f:
-        f.write(
-            """[client]
-spell-check = true
-"""
-        )
+    with open(".client.toml", "w") as f:
+        f.write('[client]\ntags = ["a", "b"]\npaths = ["/opt"]\n')
 
-    # Create a JSON configuration file.
-    json_fn = ".client.json"
-    fs.create_file(json_fn)
-    with open(json_fn, "w") as f:
-        f.write(
-            """{ "client": {
-    "spell-check": true
-  }
-}
-"""
-        )
+    with open(".client.json", "w") as f:
+        f.write('{"client": {"tags": ["b", "c"]}}\n')
 
-    # Left merge.
     conf = elective.ElectiveConfig()
     conf.load_elective_config(fn)
-    conf.load_client_config(argv=[])
 
-    assert "line-wrap" in conf.config
-    assert conf.config["line-wrap"] == elective.State((False, "default"))
+    for _ in range(2):
+        conf.load_client_config(argv=["-t", "c,d"])
 
-    assert "spell-check" in conf.config
-    assert conf.config["spell-check"] == elective.State((True, "json"))
+        assert [tag.current for tag in conf.config["tags"]] == ["a", "b", "c", "d"]
+        assert [path.current for path in conf.config["paths"]] == ["/opt"]
 
-    # Right merge.
-    conf = elective.ElectiveConfig()
-    conf.load_elective_config(fn)
-    conf.elective["combine"] = "right"
-    conf.load_client_config(argv=[])
+    # The columnar backend does not support merge strategies.
+    conf.elective["backend"] = "columnar"
 
-    assert "line-wrap" in conf.config
-    assert conf.config["line-wrap"] == elective.State((False, "default"))
+    with pytest.raises(ValueError):
+        conf.load_client_config(argv=["-t", "c,d"])
 
-    assert "spell-check" in conf.config
-    assert conf.config["spell-check"] == elective.State((False, "default"))
+    with open(fn) as f:
+        schema = f.read()
 
-    # No merge; use last.
-    conf = elective.ElectiveConfig()
-    conf.load_elective_config(fn)
-    conf.elective["combine"] = None
-    conf.load_client_config(argv=[])
+    with open(fn, "w") as f:
+        f.write(schema.replace("sparse = true", 'sparse = true\nbackend = "columnar"'))
 
-    assert "line-wrap" in conf.config
-    assert conf.config["line-wrap"] == elective.State((None, "cli"))
+    with pytest.raises(ValueError):
+        conf.load_elective_config(fn)
 
-    assert "spell-check" in conf.config
-    assert conf.config["spell-check"] == elective.State((None, "cli"))
 
-    # No merge with non-existing format.
-    conf = elective.ElectiveConfig()
-    conf.load_elective_config(fn)
-    conf.elective["combine"] = None
-    conf.elective["order"].append("unknown")
-    conf.load_client_config(argv=[])
+@pytest.mark.parametrize(
+    "option",
+    [
+        'merge = "sorted"',
+        'merge = "keyed"',
+    ],
+)
+def test_elective_config_load_merge_strategy_exception(fs, option):
+    """Should raise a ``ValueError`` for an invalid merge strategy."""
+    # Create an elective configuration file.
+    fn = "config.toml"
+    fs.create_file(fn)
+    with open(fn, "w") as f:
+        f.write(
+            f"""[elective]
 
-    assert "line-wrap" in conf.config
-    assert conf.config["line-wrap"] == elective.State((None, "cli"))
+name = "client"
 
-    assert "spell-check" in conf.config
-    assert conf.config["spell-check"] == elective.State((None, "cli"))
+[elective.options.tags]
+
+type = "list"
+default = []
+{option}
+"""
+        )
+
+    conf = elective.ElectiveConfig()
+
+    with pytest.raises(ValueError):
+        conf.load_elective_config(fn)
 
 
 def test_load_client_config_not_configured():
@@ -1228,6 +2507,189 @@ def test__merge_type_errors():
         elective.ElectiveConfig._merge(left, right)
 
 
+def test__merge_shares_unchanged():
+    """Should share unchanged subtrees without modifying the inputs."""
+    left = {
+        "one": elective.State((1, "left")),
+        "two": {
+            "one": elective.State((1, "left")),
+        },
+        "three": {
+            "one": elective.State((1, "left")),
+        },
+    }
+    right = {
+        "one": elective.State((2, "right")),
+        "two": {
+            "one": elective.State((None, "right")),
+        },
+        "four": [
+            elective.State((4, "right")),
+        ],
+    }
+
+    res = elective.ElectiveConfig._merge(left, right)
+
+    assert res["one"].values == [1, 2]
+    assert left["one"].values == [1]
+    assert right["one"].values == [2]
+
+    assert res["two"] is not left["two"]
+    assert res["two"]["one"] is left["two"]["one"]
+    assert res["three"] is left["three"]
+    assert res["four"] is right["four"]
+    assert list(left) == ["one", "two", "three"]
+
+
+def _histories(node):
+    """Get the key order and ``State`` histories of a stateful tree."""
+    if isinstance(node, elective.State):
+        return (node.values, node.sources)
+
+    if isinstance(node, dict):
+        return [(k, _histories(v)) for (k, v) in node.items()]
+
+    return [_histories(item) for item in node]
+
+
+_trees = st.dictionaries(
+    st.sampled_from(("one", "two", "three")),
+    st.recursive(
+        st.one_of(st.none(), st.integers(), st.text(max_size=2)),
+        lambda children: st.one_of(
+            st.lists(children, max_size=2),
+            st.dictionaries(
+                st.sampled_from(("one", "two", "three")),
+                children,
+                max_size=3,
+            ),
+        ),
+        max_leaves=8,
+    ),
+    max_size=3,
+)
+
+
+@given(tree=_trees)
+def test__flatten_round_trip(tree):
+    """Should unflatten a flattened tree to the same tree."""
+    stateful = elective.ElectiveConfig._make_stateful(tree, "default")
+    flat = {}
+    for k, v in stateful.items():
+        flat.update(elective.ElectiveConfig._flatten(v, (k,)))
+
+    assert _histories(elective.ElectiveConfig._unflatten(flat)) == _histories(stateful)
+
+
+@given(trees=st.lists(_trees, min_size=1, max_size=4))
+def test__merge_flat_matches_merge(trees):
+    """Should merge flat maps like ``_merge()``."""
+    stateful = [
+        elective.ElectiveConfig._make_stateful(tree, f"source{i}")
+        for (i, tree) in enumerate(trees)
+    ]
+    flat = {}
+
+    try:
+        expected = stateful[0]
+        for tree in stateful[1:]:
+            expected = elective.ElectiveConfig._merge(expected, tree)
+    except TypeError:
+        with pytest.raises(TypeError):
+            for tree in stateful:
+                elective.ElectiveConfig._merge_flat(
+                    flat, elective.ElectiveConfig._flatten(tree, ("",))
+                )
+
+        return
+
+    for tree in stateful:
+        elective.ElectiveConfig._merge_flat(
+            flat, elective.ElectiveConfig._flatten(tree, ("",))
+        )
+
+    assert _histories(elective.ElectiveConfig._unflatten(flat)) == _histories(
+        {"": expected}
+    )
+
+
+def _stateful_list(values, source):
+    """Make a stateful list."""
+    return elective.ElectiveConfig._make_stateful(values, source)
+
+
+@pytest.mark.parametrize(
+    "strategy,expected",
+    [
+        ("append", [1, 2, 2, 3, 3]),
+        ("replace", [2, 3, 3]),
+        ("union", [1, 2, 3]),
+    ],
+)
+def test__merge_list(strategy, expected):
+    """Should merge lists with a strategy."""
+    left = _stateful_list([1, 2], "left")
+    right = _stateful_list([2, 3, 3], "right")
+
+    res = elective.ElectiveConfig._merge_list(left, right, strategy)
+
+    assert [item.current for item in res] == expected
+    assert [item.current for item in left] == [1, 2]
+
+
+def test__merge_list_union_types():
+    """Should keep equal values of different types in a union."""
+    left = _stateful_list([1, "a"], "left")
+    right = _stateful_list([True, 1.5, "a", [1]], "right")
+
+    res = elective.ElectiveConfig._merge_list(left, right, "union")
+
+    assert [getattr(item, "current", item) for item in res] == [
+        1,
+        "a",
+        True,
+        1.5,
+        [elective.State((1, "right"))],
+    ]
+
+
+def test__merge_list_keyed():
+    """Should merge keyed items by field."""
+    left = _stateful_list(
+        [{"name": "a", "width": 1}, {"name": "b", "width": 2}],
+        "left",
+    )
+    right = _stateful_list(
+        [{"name": "b", "width": 3}, {"name": "c", "width": 4}, {"width": 5}],
+        "right",
+    )
+
+    res = elective.ElectiveConfig._merge_list(left, right, "keyed", "name")
+
+    assert [item.get("name", None) for item in res] == [
+        elective.State(("a", "left")),
+        elective.State(("b", "right")),
+        elective.State(("c", "right")),
+        None,
+    ]
+    assert res[1]["width"].values == [2, 3]
+    assert res[1]["width"].sources == ["left", "right"]
+    assert left[1]["width"].values == [2]
+
+
+def test__merge_list_unset():
+    """Should replace unset values and merge other values."""
+    items = _stateful_list([1], "right")
+    unset = elective.State((None, "cli"))
+
+    assert elective.ElectiveConfig._merge_list(None, items, "union") is items
+    assert elective.ElectiveConfig._merge_list(unset, items, "union") is items
+    assert elective.ElectiveConfig._merge_list(items, unset, "union") is items
+
+    with pytest.raises(TypeError):
+        elective.ElectiveConfig._merge_list(items, elective.State((1, "cli")), "union")
+
+
 def test__make_stateful_none():
     """Should make ``None`` stateful."""
     expected = elective.State((None, "default"))
@@ -48,6 +48,18 @@ def test_load_multiple_definitions(monkeypatch):
     assert "defined multiple times" in str(exc.value)
 
 
+def test_load_multiple_definitions_parent_first(monkeypatch):
+    """Should raise on a value defined after its children."""
+    monkeypatch.setenv("ELECTIVE_TEST_CHECK__ONE__ONE", "1")
+    monkeypatch.setenv("ELECTIVE_TEST_CHECK", "true")
+    env = elective.EnvConfiguration(prefix="ELECTIVE_TEST_")
+
+    with pytest.raises(elective.ElectivePathConflictError) as exc:
+        env.load()
+
+    assert exc.value.path == ("CHECK",)
+
+
 def test_load_undefined(monkeypatch):
     """Should raise ``KeyError`` on undefined variables."""
     monkeypatch.setenv("ELECTIVE_TEST_CHECK", "true")
@@ -344,3 +356,222 @@ def test_dump_sh(monkeypatch):
     output = env.dump()
     for name, val in vals:
         assert f"export {name!s}='{val!s}'" in output
+
+
+def test_load_schema_coercion(monkeypatch):
+    """Should convert schema options to their types."""
+    schema = {
+        "spell-check": {"type": "boolean_group"},
+        "line-wrap": {"type": "boolean"},
+        "width": {"type": "int"},
+        "ratio": {"type": "float"},
+        "name": {"type": "str"},
+        "words": {"type": "list"},
+        "letters": {"type": "list"},
+        "mapping": {"type": "json"},
+        "home": {"type": "path"},
+        "timeout": {"type": "duration"},
+        "cache": {"type": "bytes"},
+        "headers": {"type": "dict"},
+        "labels": {"type": "dict"},
+        "color": {"type": "choices"},
+        "level": {"type": "enum"},
+        "custom": {"type": "custom"},
+        "show-license": {"type": "display"},
+    }
+
+    monkeypatch.setenv("HOME", "/home/test")
+
+    monkeypatch.setenv("ELECTIVE_TEST_SPELL_CHECK", "yes")
+    monkeypatch.setenv("ELECTIVE_TEST_LINE_WRAP", "False")
+    monkeypatch.setenv("ELECTIVE_TEST_WIDTH", "72")
+    monkeypatch.setenv("ELECTIVE_TEST_RATIO", "0.5")
+    monkeypatch.setenv("ELECTIVE_TEST_NAME", "72")
+    monkeypatch.setenv("ELECTIVE_TEST_WORDS", "one, two,three")
+    monkeypatch.setenv("ELECTIVE_TEST_LETTERS__0", "a")
+    monkeypatch.setenv("ELECTIVE_TEST_LETTERS__1", "b")
+    monkeypatch.setenv("ELECTIVE_TEST_MAPPING", '{"a": [1, 2]}')
+    monkeypatch.setenv("ELECTIVE_TEST_HOME", "~/elective")
+    monkeypatch.setenv("ELECTIVE_TEST_TIMEOUT", "1h")
+    monkeypatch.setenv("ELECTIVE_TEST_CACHE", "1KiB")
+    monkeypatch.setenv("ELECTIVE_TEST_HEADERS", "a=1, b=2")
+    monkeypatch.setenv("ELECTIVE_TEST_LABELS__A", "1")
+    monkeypatch.setenv("ELECTIVE_TEST_COLOR", "red")
+    monkeypatch.setenv("ELECTIVE_TEST_LEVEL", "high")
+    monkeypatch.setenv("ELECTIVE_TEST_CUSTOM", "raw")
+    monkeypatch.setenv("ELECTIVE_TEST_SHOW_LICENSE", "1")
+    monkeypatch.setenv("ELECTIVE_TEST_OTHER", "1")
+
+    env = elective.EnvConfiguration(prefix="ELECTIVE_TEST_", schema=schema)
+    env.load()
+
+    assert env.options == {
+        "spell-check": True,
+        "line-wrap": False,
+        "width": 72,
+        "ratio": 0.5,
+        "name": "72",
+        "words": ["one", "two", "three"],
+        "letters": ["a", "b"],
+        "mapping": {"a": [1, 2]},
+        "home": "/home/test/elective",
+        "timeout": 3600.0,
+        "cache": 1024,
+        "headers": {"a": "1", "b": "2"},
+        "labels": {"A": "1"},
+        "color": "red",
+        "level": "high",
+        "custom": "raw",
+        "SHOW_LICENSE": "1",
+        "OTHER": "1",
+    }
+
+
+def test_load_schema_reuses_converters(monkeypatch):
+    """Should reuse the compiled converters across loads."""
+    env = elective.EnvConfiguration(
+        prefix="ELECTIVE_TEST_",
+        schema={"width": {"type": "int"}},
+    )
+    converters = env._converters
+
+    monkeypatch.setenv("ELECTIVE_TEST_WIDTH", "72")
+    env.load()
+    assert env.options == {"width": 72}
+
+    monkeypatch.setenv("ELECTIVE_TEST_WIDTH", "80")
+    env.load()
+    assert env.options == {"width": 80}
+    assert env._converters is converters
+
+
+@pytest.mark.parametrize(
+    "kind,val",
+    (
+        ("boolean", "maybe"),
+        ("int", "seven"),
+        ("float", "half"),
+        ("json", "{"),
+        ("duration", "soon"),
+        ("bytes", "lots"),
+        ("dict", "key"),
+    ),
+)
+def test_load_schema_coercion_error(kind, val, monkeypatch):
+    """Should raise ``ValueError`` on values of the wrong type."""
+    monkeypatch.setenv("ELECTIVE_TEST_OPT", val)
+
+    env = elective.EnvConfiguration(
+        prefix="ELECTIVE_TEST_",
+        schema={"opt": {"type": kind}},
+    )
+
+    with pytest.raises(ValueError) as exc:
+        env.load()
+
+    assert "ELECTIVE_TEST_OPT" in str(exc.value)
+    assert kind in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    "kind,name",
+    (
+        ("boolean", "OPT__0"),
+        ("boolean", "OPT__KEY"),
+        ("list", "OPT__KEY"),
+        ("dict", "OPT__0"),
+        ("duration", "OPT__0"),
+    ),
+)
+def test_load_schema_coercion_structured_error(kind, name, monkeypatch):
+    """Should raise ``ValueError`` on structured values of scalar types."""
+    monkeypatch.setenv(f"ELECTIVE_TEST_{name}", "yes")
+
+    env = elective.EnvConfiguration(
+        prefix="ELECTIVE_TEST_",
+        schema={"opt": {"type": kind}},
+    )
+
+    with pytest.raises(ValueError) as exc:
+        env.load()
+
+    assert "ELECTIVE_TEST_OPT" in str(exc.value)
+
+
+def test_load_incremental(monkeypatch):
+    """Should rebuild only changed subtrees on reload."""
+    monkeypatch.setenv("ELECTIVE_TEST_FRUIT__APPLE", "2")
+    monkeypatch.setenv("ELECTIVE_TEST_FRUIT__BANANA", "3")
+    monkeypatch.setenv("ELECTIVE_TEST_LIST__0", "apple")
+    monkeypatch.setenv("ELECTIVE_TEST_BREAKFAST", "toast")
+
+    env = elective.EnvConfiguration(prefix="ELECTIVE_TEST_")
+    env.load()
+
+    fruit = env.options["FRUIT"]
+    fruits = env.options["LIST"]
+
+    # No changes.
+    options = env.options
+    env.load()
+    assert env.options is options
+
+    # Change one subtree.
+    monkeypatch.setenv("ELECTIVE_TEST_FRUIT__BANANA", "4")
+    env.load()
+    assert env.options["FRUIT"] == {"APPLE": "2", "BANANA": "4"}
+    assert env.options["FRUIT"] is not fruit
+    assert env.options["LIST"] is fruits
+
+    # Add and remove variables.
+    monkeypatch.setenv("ELECTIVE_TEST_LIST__1", "banana")
+    monkeypatch.delenv("ELECTIVE_TEST_BREAKFAST")
+    env.load()
+    assert env.options == {
+        "FRUIT": {"APPLE": "2", "BANANA": "4"},
+        "LIST": ["apple", "banana"],
+    }
+
+    # Remove a whole subtree.
+    monkeypatch.delenv("ELECTIVE_TEST_LIST__0")
+    monkeypatch.delenv("ELECTIVE_TEST_LIST__1")
+    env.load()
+    assert env.options == {
+        "FRUIT": {"APPLE": "2", "BANANA": "4"},
+    }
+
+
+def test_load_incremental_conflict_retries(monkeypatch):
+    """Should keep the previous load after a conflicting reload."""
+    monkeypatch.setenv("ELECTIVE_TEST_CHECK__ONE", "1")
+
+    env = elective.EnvConfiguration(prefix="ELECTIVE_TEST_")
+    env.load()
+
+    monkeypatch.setenv("ELECTIVE_TEST_CHECK", "true")
+    with pytest.raises(elective.ElectivePathConflictError):
+        env.load()
+
+    assert env.options == {"CHECK": {"ONE": "1"}}
+
+    monkeypatch.delenv("ELECTIVE_TEST_CHECK__ONE")
+    env.load()
+    assert env.options == {"CHECK": "true"}
+
+
+def test_load_schema_registered_type(monkeypatch):
+    """Should convert registered option types."""
+    # Remove the registration after the test.
+    monkeypatch.setitem(elective.cli._option_types, "upper", None)
+    monkeypatch.setitem(elective.cli._value_converters, "upper", None)
+    elective.CliConfiguration.register_type("upper", converter=str.upper)
+
+    monkeypatch.setenv("ELECTIVE_TEST_NAME", "shout")
+
+    env = elective.EnvConfiguration(
+        prefix="ELECTIVE_TEST_",
+        schema={"name": {"type": "upper"}},
+    )
+    env.load()
+
+    assert env.options == {"name": "SHOUT"}
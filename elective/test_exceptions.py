@@ -36,3 +36,22 @@ def test_ElectiveFileDecodingError___repr__():
         raises("I will fail")
 
     assert repr(exc.value) == f"ElectiveFileDecodingError(message={'I will fail'!r},)"
+
+
+def test_ElectivePathConflictError___str__():
+    """Should stringify a ``ElectivePathConflictError``."""
+    with pytest.raises(elective.ElectivePathConflictError) as exc:
+        raise elective.ElectivePathConflictError("I will fail", path=("a",))
+
+    assert str(exc.value) == "I will fail"
+    assert exc.value.path == ("a",)
+
+
+def test_ElectivePathConflictError___repr__():
+    """Should reproduce a ``ElectivePathConflictError``."""
+    with pytest.raises(elective.ElectivePathConflictError) as exc:
+        raise elective.ElectivePathConflictError("I will fail", path=("a",))
+
+    assert repr(exc.value) == (
+        f"ElectivePathConflictError(message={'I will fail'!r}, path={('a',)!r},)"
+    )
@@ -234,3 +234,37 @@ def test_load_good_bespon_file(fs):
     }
 
     assert actual == expected
+
+
+def test_load_bytes_read(fs):
+    """Should count the bytes read, attempts, and failures of loaders."""
+    fn = "config.txt"
+    fs.create_file(fn)
+
+    with open(fn, "w") as file:
+        file.write('option = "toml"\n')
+
+    cf = elective.FileConfiguration(fn)
+    cf.load()
+
+    assert cf.bytes_read == 16
+    assert cf.attempts == 1
+    assert cf.failures == 0
+
+    # TOML fails first, then YAML loads.
+    with open(fn, "w") as file:
+        file.write('{"option": "json"}\n')
+
+    cf.load()
+
+    assert cf.options == {"option": "json"}
+    assert cf.bytes_read == 38
+    assert cf.attempts == 2
+    assert cf.failures == 1
+
+    cf = elective.FileConfiguration("missing.txt", raise_on_file_error=False)
+    cf.load()
+
+    assert cf.bytes_read == 0
+    assert cf.attempts == 1
+    assert cf.failures == 1
@@ -0,0 +1,161 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""``ProvenanceStore`` tests."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+import elective
+
+scalars = st.one_of(
+    st.none(),
+    st.integers(),
+    st.booleans(),
+    st.text(max_size=4),
+)
+
+trees = st.dictionaries(
+    st.sampled_from(("one", "two", "three")),
+    st.recursive(
+        scalars,
+        lambda children: st.one_of(
+            st.lists(children, max_size=3),
+            st.dictionaries(
+                st.sampled_from(("one", "two", "three")),
+                children,
+                max_size=3,
+            ),
+        ),
+        max_leaves=8,
+    ),
+    max_size=3,
+)
+
+
+def _materialize(node):
+    """Convert a provenance view to plain containers of ``State``."""
+    if isinstance(node, elective.State):
+        return (node.values, node.sources)
+
+    if isinstance(node, list) or not hasattr(node, "keys"):
+        return [_materialize(item) for item in node]
+
+    return {k: _materialize(v) for (k, v) in node.items()}
+
+
+def test_provenance_store_merge():
+    """Should record each merged value as a row."""
+    store = elective.ProvenanceStore()
+    store.merge({"width": 72, "tags": ["a"], "sub": {"wrap": None}}, "default")
+    store.merge({"width": 80, "tags": ["b"], "sub": {"wrap": True}}, "toml")
+    store.merge({"width": None, "sub": {"wrap": None}}, "cli")
+
+    assert len(store) == 6
+    assert store.current == {
+        ("width",): 80,
+        ("tags", 0): "a",
+        ("tags", 1): "b",
+        ("sub", "wrap"): True,
+    }
+    assert store.source(("width",)) == "toml"
+
+    assert store.state(("width",)) == elective.State((80, "toml"))
+    assert store.state(("width",)).values == [72, 80]
+    assert store.state(("width",)).sources == ["default", "toml"]
+
+    config = store.view()
+
+    assert list(config) == ["width", "tags", "sub"]
+    assert config["tags"] == [
+        elective.State(("a", "default")),
+        elective.State(("b", "toml")),
+    ]
+    assert config["sub"] == {"wrap": elective.State((True, "toml"))}
+
+    with pytest.raises(KeyError):
+        config["missing"]
+
+    with pytest.raises(IndexError):
+        config["tags"][2]
+
+    with pytest.raises(KeyError):
+        store.state(("sub",))
+
+
+def test_provenance_store_max_history():
+    """Should bound the history of ``State`` views."""
+    store = elective.ProvenanceStore(max_history=2)
+
+    for source in ("default", "toml", "json", "cli"):
+        store.merge({"width": len(source)}, source)
+
+    assert len(store) == 4
+    assert store.state(("width",)).values == [4, 3]
+    assert store.state(("width",)).sources == ["json", "cli"]
+
+
+def test_provenance_store_type_errors():
+    """Should raise mis-matched type errors."""
+    store = elective.ProvenanceStore()
+    store.merge({"one": 1, "two": {"one": 1}}, "default")
+
+    with pytest.raises(TypeError):
+        store.merge({"one": [1]}, "cli")
+
+    with pytest.raises(TypeError):
+        store.merge({"one": {"one": 1}}, "cli")
+
+    with pytest.raises(TypeError):
+        store.merge({"two": 1}, "cli")
+
+
+def test_provenance_store_replaces_empty():
+    """Should replace empty lists and dicts, like ``_merge()``."""
+    store = elective.ProvenanceStore()
+    store.merge({"one": [], "two": {}}, "default")
+    store.merge({"one": 1, "two": [2]}, "cli")
+
+    assert store.view() == {
+        "one": elective.State((1, "cli")),
+        "two": [elective.State((2, "cli"))],
+    }
+
+
+def test_provenance_store_not_implemented():
+    """Should raise NotImplementedError."""
+    with pytest.raises(NotImplementedError):
+        elective.ProvenanceStore().merge({"one": object()}, "default")
+
+
+@given(left=trees, right=trees)
+def test_provenance_store_matches_merge(left, right):
+    """Should merge like ``ElectiveConfig._merge()``."""
+    try:
+        expected = elective.ElectiveConfig._merge(
+            elective.ElectiveConfig._make_stateful(left, "toml"),
+            elective.ElectiveConfig._make_stateful(right, "cli"),
+        )
+    except TypeError:
+        with pytest.raises(TypeError):
+            store = elective.ProvenanceStore()
+            store.merge(left, "toml")
+            store.merge(right, "cli")
+
+        return
+
+    store = elective.ProvenanceStore()
+    store.merge(left, "toml")
+    store.merge(right, "cli")
+
+    assert _materialize(store.view()) == _materialize(expected)
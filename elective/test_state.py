@@ -12,7 +12,11 @@
 
 """``State`` class tests."""
 
+import copy
 import math
+import pickle
+import subprocess
+import sys
 
 import pytest
 from hypothesis import example, given
@@ -292,3 +296,124 @@ def test_state_append_bad_other(one, two):
 
     with pytest.raises(TypeError):
         initial.append(update)
+
+
+def test_state_compact():
+    """Should store states compactly."""
+    state = elective.State((1, "default"))
+
+    assert not hasattr(state, "__dict__")
+    assert state._history == ()
+
+    with pytest.raises(AttributeError):
+        state.bob = 1
+
+    state.update(2, "cli")
+    assert state._history == ((1, elective.state._intern_source("default")),)
+    assert state.current == 2
+
+
+def test_state_copy():
+    """Should copy a state independently of the original."""
+    state = elective.State((1, "default"), (2, "toml"))
+
+    for copied in (copy.copy(state), copy.deepcopy(state)):
+        assert copied is not state
+        assert copied == state
+        assert copied.values == [1, 2]
+        assert copied.sources == ["default", "toml"]
+
+        copied.update(3, "cli")
+        assert state.values == [1, 2]
+        assert copied.values == [1, 2, 3]
+
+
+def test_state___eq___other_types():
+    """Should not equal non-states."""
+    assert elective.State((1, "default")) != 1
+    assert elective.State((1, "default")) != (1, "default")
+
+
+def test_state_max_history():
+    """Should keep only the most recent entries."""
+    state = elective.State((1, "default"), (2, "toml"), max_history=2)
+
+    assert state.max_history == 2
+    assert state.values == [1, 2]
+
+    state.update(3, "env")
+    assert state.values == [2, 3]
+    assert state.sources == ["toml", "env"]
+
+    state.append(elective.State((4, "cli"), (5, "cli")))
+    assert state.values == [4, 5]
+    assert state.current == 5
+
+    state = elective.State((1, "default"), (2, "toml"), max_history=1)
+    assert state._history == ()
+    assert state.values == [2]
+
+    assert copy.copy(state).max_history == 1
+    assert elective.State().max_history is None
+
+
+@pytest.mark.parametrize("max_history", (0, -1))
+def test_state_max_history_invalid(max_history):
+    """Should raise on a ``max_history`` less than one."""
+    with pytest.raises(ValueError):
+        elective.State(max_history=max_history)
+
+
+def test_state_interned_sources():
+    """Should intern sources as small integer ids."""
+    state = elective.State((1, "default"), (2, "my-provider"))
+    source_id = elective.state._intern_source("my-provider")
+
+    assert elective.state._intern_source("default") == 0
+    assert elective.state._intern_source("my-provider") == source_id
+    assert state._source == source_id
+    assert state.source == "my-provider"
+    assert state.sources == ["default", "my-provider"]
+    assert str(state) == "current value: 2 source: my-provider"
+    assert repr(state) == "State((2, my-provider))"
+    assert elective.State().source is None
+
+    assert state == elective.State((2, "my-provider"))
+    assert state != elective.State((2, "default"))
+
+
+def test_state_pickle():
+    """Should pickle states by source name."""
+    state = elective.State(
+        (1, "default"),
+        (2, "test-pickle-override"),
+        max_history=3,
+    )
+
+    unpickled = pickle.loads(pickle.dumps(state))  # noqa: S301
+
+    assert unpickled == state
+    assert unpickled.values == [1, 2]
+    assert unpickled.sources == ["default", "test-pickle-override"]
+    assert unpickled.max_history == 3
+
+    empty = pickle.loads(pickle.dumps(elective.State()))  # noqa: S301
+
+    assert empty.values == []
+    assert empty.source is None
+
+    # Unpickle in a process with other interned sources.
+    code = (
+        "import pickle, sys, elective;"
+        "elective.State((0, 'test-pickle-other'));"
+        "state = pickle.loads(sys.stdin.buffer.read());"
+        "print(state.sources)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        input=pickle.dumps(state),
+        capture_output=True,
+        check=True,
+    )
+
+    assert result.stdout.decode().strip() == "['default', 'test-pickle-override']"
@@ -0,0 +1,71 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Load statistics tests."""
+
+import pytest
+
+import elective
+from elective.stats import _shape
+
+
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        (1, (0, 0)),
+        ({}, (0, 1)),
+        ({"one": 1, "two": 2}, (2, 1)),
+        ({"one": {"two": [1, {"three": 3}]}}, (3, 4)),
+        ([[], [[]]], (0, 3)),
+    ],
+)
+def test__shape(values, expected):
+    """Should count keys and measure depth."""
+    assert _shape(values) == expected
+
+
+def test_provider_stats():
+    """Should measure the provider's options when needed."""
+    stats = elective.ProviderStats("toml")
+
+    assert stats.keys == 0
+    assert stats.max_depth == 0
+
+    stats._set_values({"one": {"two": 2}})
+
+    assert stats.keys == 2
+    assert stats.max_depth == 2
+    assert stats.as_dict() == {
+        "name": "toml",
+        "wall_time": 0.0,
+        "bytes_read": 0,
+        "attempts": 0,
+        "failures": 0,
+        "keys": 2,
+        "max_depth": 2,
+        "stateful_time": 0.0,
+        "merge_time": 0.0,
+    }
+    assert repr(stats) == f"ProviderStats({stats.as_dict()!r})"
+
+
+def test_load_stats():
+    """Should add provider statistics once, in order."""
+    stats = elective.LoadStats()
+
+    toml = stats.provider("toml")
+
+    assert stats.provider("cli") is not toml
+    assert stats.provider("toml") is toml
+    assert list(stats.providers) == ["toml", "cli"]
+    assert list(stats.as_dict()["providers"]) == ["toml", "cli"]
+    assert repr(stats) == f"LoadStats({stats.as_dict()!r})"
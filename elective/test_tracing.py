@@ -0,0 +1,166 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Instrumentation tests."""
+
+import json
+import logging
+import os
+
+import pytest
+
+import elective
+
+
+def test_tracer_span():
+    """Should emit timed spans with their attributes."""
+    sink = elective.MemorySink()
+    tracer = elective.Tracer(sinks=[sink])
+
+    with tracer.span("outer", provider="cli") as span:
+        with tracer.span("inner"):
+            pass
+
+        span.set(keys=3)
+
+    assert [event["name"] for event in sink] == ["inner", "outer"]
+    assert sink[1]["type"] == "span"
+    assert sink[1]["attrs"] == {"provider": "cli", "keys": 3}
+    assert sink[1]["duration"] >= sink[0]["duration"] >= 0
+    assert sink[1]["start"] <= sink[0]["start"]
+
+
+def test_tracer_span_error():
+    """Should emit spans ending in errors."""
+    sink = elective.MemorySink()
+    tracer = elective.Tracer(sinks=[sink])
+
+    with pytest.raises(KeyError):
+        with tracer.span("failing"):
+            raise KeyError("missing")
+
+    assert sink[0]["attrs"] == {"error": "KeyError"}
+
+
+def test_tracer_count():
+    """Should emit counters to every sink."""
+    sinks = [elective.MemorySink(), elective.MemorySink()]
+    tracer = elective.Tracer(sinks=sinks)
+
+    tracer.count("bytes_read", 42, provider="toml")
+
+    for sink in sinks:
+        assert len(sink) == 1
+        assert sink[0]["type"] == "count"
+        assert sink[0]["name"] == "bytes_read"
+        assert sink[0]["value"] == 42
+        assert sink[0]["attrs"] == {"provider": "toml"}
+        assert sink[0]["time"] > 0
+        assert sink[0]["pid"] == os.getpid()
+
+
+def test_null_tracer():
+    """Should do nothing."""
+    tracer = elective.NullTracer()
+
+    assert not tracer.enabled
+
+    with tracer.span("nothing", provider="cli") as span:
+        span.set(keys=3)
+
+    tracer.count("nothing", 1)
+    tracer.flush()
+
+    assert tracer.span("one") is tracer.span("two")
+
+
+def test_logging_sink(caplog):
+    """Should log events."""
+    tracer = elective.Tracer(sinks=[elective.LoggingSink()])
+
+    with caplog.at_level(logging.DEBUG, logger="elective"):
+        with tracer.span("merge", keys=2):
+            pass
+
+        tracer.count("bytes_read", 42)
+
+    assert caplog.records[0].message.startswith("merge took ")
+    assert caplog.records[0].event["attrs"] == {"keys": 2}
+    assert caplog.records[1].message == "bytes_read = 42 {}"
+
+
+def test_logging_sink_disabled(caplog):
+    """Should not log below the logger's level."""
+    tracer = elective.Tracer(sinks=[elective.LoggingSink()])
+
+    with caplog.at_level(logging.INFO, logger="elective"):
+        tracer.count("bytes_read", 42)
+
+    assert caplog.records == []
+
+
+def test_chrome_trace_sink(tmp_path):
+    """Should write spans and counters as Chrome trace events."""
+    fn = tmp_path / "trace.json"
+    tracer = elective.Tracer(sinks=[elective.ChromeTraceSink(str(fn))])
+
+    tracer.flush()
+
+    with open(fn) as f:
+        assert json.load(f)["traceEvents"] == []
+
+    with tracer.span("parse", provider="toml"):
+        tracer.count("bytes_read", 42, provider="toml")
+        tracer.count("total", 7)
+
+    tracer.flush()
+
+    assert tracer.sinks[0].events == []
+
+    with tracer.span("merge"):
+        pass
+
+    tracer.flush()
+    tracer.flush()
+
+    with open(fn) as f:
+        trace = json.load(f)
+
+    (bytes_read, total, parse, merge) = trace["traceEvents"]
+
+    assert parse["name"] == "parse"
+    assert parse["ph"] == "X"
+    assert parse["args"] == {"provider": "toml"}
+    assert parse["pid"] == os.getpid()
+    assert parse["dur"] >= 0
+    assert bytes_read["ph"] == "C"
+    assert bytes_read["args"] == {"toml": 42}
+    assert total["args"] == {"total": 7}
+    assert parse["ts"] <= bytes_read["ts"] <= parse["ts"] + parse["dur"]
+    assert merge["name"] == "merge"
+
+
+def test_default_tracer(monkeypatch, tmp_path):
+    """Should trace to the file in ``ELECTIVE_TRACE``."""
+    monkeypatch.setattr(elective.tracing, "_chrome_sinks", {})
+    monkeypatch.delenv("ELECTIVE_TRACE", raising=False)
+    assert elective.tracing._default_tracer() is elective.tracing._NULL_TRACER
+
+    fn = str(tmp_path / "trace.json")
+    monkeypatch.setenv("ELECTIVE_TRACE", fn)
+    tracer = elective.tracing._default_tracer()
+
+    assert tracer.enabled
+    assert isinstance(tracer.sinks[0], elective.ChromeTraceSink)
+    assert tracer.sinks[0].path == fn
+    assert elective.tracing._default_tracer().sinks[0] is tracer.sinks[0]
+    assert elective.ChromeTraceSink.shared(fn) is tracer.sinks[0]
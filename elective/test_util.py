@@ -12,6 +12,8 @@
 
 """Environment configuration tests."""
 
+import pytest
+
 import elective
 
 
@@ -219,3 +221,67 @@ def test__format_sh_formats_strings():
     expected = "export ELECTIVE_TEST='yay'"
 
     assert actual == expected
+
+
+def test__build_tree():
+    """Should build a nested dict from path and value pairs."""
+    pairs = [
+        (("BREAKFAST",), "toast"),
+        (("FRUIT", "APPLE"), "2"),
+        (("FRUIT", "BANANA"), "3"),
+        (("FOOD", "FRUIT", "APPLE"), "2"),
+        (("FOOD", "LIST", "0"), "apple"),
+    ]
+
+    expected = {
+        "BREAKFAST": "toast",
+        "FRUIT": {
+            "APPLE": "2",
+            "BANANA": "3",
+        },
+        "FOOD": {
+            "FRUIT": {
+                "APPLE": "2",
+            },
+            "LIST": {
+                "0": "apple",
+            },
+        },
+    }
+
+    assert elective._build_tree(pairs) == expected
+    assert elective._build_tree([]) == {}
+
+
+def test__build_tree_conflicts():
+    """Should raise on conflicting paths."""
+    with pytest.raises(elective.ElectivePathConflictError) as exc:
+        elective._build_tree(
+            [
+                (("CHECK",), "true"),
+                (("CHECK", "ONE"), "1"),
+            ]
+        )
+
+    assert exc.value.path == ("CHECK",)
+
+    with pytest.raises(elective.ElectivePathConflictError) as exc:
+        elective._build_tree(
+            [
+                (("CHECK", "ONE"), "1"),
+                (("CHECK",), "true"),
+            ]
+        )
+
+    assert exc.value.path == ("CHECK",)
+
+    with pytest.raises(elective.ElectivePathConflictError) as exc:
+        elective._build_tree(
+            [
+                (("CHECK", "ONE"), "1"),
+                (("CHECK", "ONE"), "2"),
+            ]
+        )
+
+    assert exc.value.path == ("CHECK", "ONE")
+    assert "defined multiple times" in str(exc.value)
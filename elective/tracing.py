@@ -0,0 +1,349 @@
+# ******************************************************************************
+#
+# elective, a Python configuration loader generator
+#
+# Copyright 2021-2026 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# ******************************************************************************
+
+"""Configuration loading instrumentation."""
+
+import json
+import logging
+import os
+import threading
+import time
+
+
+class _Span:
+    """Timing span of a ``Tracer``."""
+
+    __slots__ = ("_tracer", "attrs", "name", "start")
+
+    def __init__(self, tracer, name, attrs):
+        """Initialize a span."""
+        self._tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = None
+
+    def __enter__(self):
+        """Start the span."""
+        self.start = time.perf_counter_ns()
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """End the span and emit it."""
+        end = time.perf_counter_ns()
+
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+
+        self._tracer._emit(
+            {
+                "type": "span",
+                "name": self.name,
+                "start": self.start,
+                "duration": end - self.start,
+                "pid": os.getpid(),
+                "thread": threading.get_ident(),
+                "attrs": self.attrs,
+            }
+        )
+
+        return False
+
+    def set(self, **attrs):
+        """Set attributes of the span, such as counts."""
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """Emit timing spans and counters to sinks.
+
+    Sinks are callables accepting an event dict.  Span events have
+    the ``type`` ``"span"``, the span ``name``, its ``start`` and
+    ``duration`` in nanoseconds (from ``time.perf_counter_ns()``),
+    the ``pid`` and ``thread``, and the span ``attrs``.  Counter
+    events have the ``type`` ``"count"``, the counter ``name``, its
+    ``value``, its ``time`` in nanoseconds, the ``pid`` and
+    ``thread``, and ``attrs``.
+    """
+
+    enabled = True
+
+    def __init__(self, sinks=None):
+        """Initialize a tracer.
+
+        Parameters
+        ----------
+        sinks : list, default=None
+            Callables accepting each event dict.
+
+        """
+        self.sinks = list(sinks or [])
+
+    def _emit(self, event):
+        """Send an event to each sink."""
+        for sink in self.sinks:
+            sink(event)
+
+    def span(self, name, **attrs):
+        """Time a block.
+
+        Parameters
+        ----------
+        name : str
+            Span name.
+        **attrs
+            Span attributes.
+
+        Returns
+        -------
+        context manager
+            The span, with ``set()`` to add attributes.
+
+        """
+        return _Span(self, name, attrs)
+
+    def count(self, name, value, **attrs):
+        """Emit a counter.
+
+        Parameters
+        ----------
+        name : str
+            Counter name.
+        value : int
+            Counter value.
+        **attrs
+            Counter attributes.
+
+        """
+        self._emit(
+            {
+                "type": "count",
+                "name": name,
+                "value": value,
+                "time": time.perf_counter_ns(),
+                "pid": os.getpid(),
+                "thread": threading.get_ident(),
+                "attrs": attrs,
+            }
+        )
+
+    def flush(self):
+        """Flush each sink with a ``flush()`` method."""
+        for sink in self.sinks:
+            flush = getattr(sink, "flush", None)
+
+            if flush is not None:
+                flush()
+
+
+class _NullSpan:
+    """Span of a ``NullTracer``, doing nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """Do nothing."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Do nothing."""
+        return False
+
+    def set(self, **attrs):
+        """Do nothing."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """Tracer doing nothing, the default.
+
+    Check ``enabled`` before computing expensive span attributes.
+    """
+
+    enabled = False
+    sinks = ()
+
+    def span(self, name, **attrs):
+        """Do nothing."""
+        return _NULL_SPAN
+
+    def count(self, name, value, **attrs):
+        """Do nothing."""
+
+    def flush(self):
+        """Do nothing."""
+
+
+_NULL_TRACER = NullTracer()
+
+
+class MemorySink(list):
+    """Sink collecting events in a list."""
+
+    def __call__(self, event):
+        """Collect an event."""
+        self.append(event)
+
+
+class LoggingSink:
+    """Sink logging events."""
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        """Initialize a logging sink.
+
+        Parameters
+        ----------
+        logger : logging.Logger, default=None
+            Logger, or ``None`` for the ``elective`` logger.
+        level : int, default=logging.DEBUG
+            Logging level.
+
+        """
+        self.logger = logger or logging.getLogger("elective")
+        self.level = level
+
+    def __call__(self, event):
+        """Log an event, with the event in the record's ``event``."""
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        if event["type"] == "span":
+            self.logger.log(
+                self.level,
+                "%s took %.3f ms %s",
+                event["name"],
+                event["duration"] / 1e6,
+                event["attrs"],
+                extra={"event": event},
+            )
+        else:
+            self.logger.log(
+                self.level,
+                "%s = %s %s",
+                event["name"],
+                event["value"],
+                event["attrs"],
+                extra={"event": event},
+            )
+
+
+class ChromeTraceSink:
+    """Sink writing Chrome trace events.
+
+    Collect spans as complete (``X``) events and counters as counter
+    (``C``) events, and append them to a trace event JSON file, for
+    ``chrome://tracing`` or Perfetto, on each ``flush()``.  Written
+    events are discarded, and the file is valid JSON after each
+    flush.  Get a sink with ``shared()`` to share it, and its file,
+    with every tracer writing to the same path.
+    """
+
+    def __init__(self, path):
+        """Initialize a Chrome trace sink.
+
+        Parameters
+        ----------
+        path : str
+            Path of the trace file.
+
+        """
+        self.path = path
+        self.events = []
+        self._written = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, path):
+        """Get the shared sink writing to ``path``."""
+        key = os.path.abspath(path)
+
+        with _chrome_sinks_lock:
+            sink = _chrome_sinks.get(key, None)
+
+            if sink is None:
+                sink = _chrome_sinks[key] = cls(path)
+
+        return sink
+
+    def __call__(self, event):
+        """Convert and collect an event."""
+        if event["type"] == "span":
+            converted = {
+                "name": event["name"],
+                "cat": "elective",
+                "ph": "X",
+                "ts": event["start"] / 1000,
+                "dur": event["duration"] / 1000,
+                "pid": event["pid"],
+                "tid": event["thread"],
+                "args": event["attrs"],
+            }
+        else:
+            series = ".".join(str(v) for v in event["attrs"].values())
+            converted = {
+                "name": event["name"],
+                "cat": "elective",
+                "ph": "C",
+                "ts": event["time"] / 1000,
+                "pid": event["pid"],
+                "tid": event["thread"],
+                "args": {series or event["name"]: event["value"]},
+            }
+
+        with self._lock:
+            self.events.append(converted)
+
+    def flush(self):
+        """Append the collected events to the trace file."""
+        with self._lock:
+            (events, self.events) = (self.events, [])
+            body = ",\n".join(json.dumps(event, default=repr) for event in events)
+
+            # Start a new file on the first flush, or if it is gone.
+            if self._written is None or not os.path.exists(self.path):
+                with open(self.path, "wb") as f:
+                    f.write(f"{_CHROME_HEAD}{body}{_CHROME_TAIL}".encode())
+
+                self._written = bool(body)
+            elif body:
+                # Overwrite the tail to append the events.
+                separator = ",\n" if self._written else ""
+
+                with open(self.path, "r+b") as f:
+                    f.seek(-len(_CHROME_TAIL), os.SEEK_END)
+                    f.write(f"{separator}{body}{_CHROME_TAIL}".encode())
+
+                self._written = True
+
+
+_CHROME_HEAD = '{"displayTimeUnit": "ms", "traceEvents": [\n'
+_CHROME_TAIL = "\n]}\n"
+
+# Shared Chrome trace sinks, keyed by absolute path.
+_chrome_sinks = {}
+_chrome_sinks_lock = threading.Lock()
+
+
+def _default_tracer():
+    """Get the default tracer.
+
+    Trace to the shared Chrome trace sink of the file named by the
+    ``ELECTIVE_TRACE`` environment variable, if set, or do nothing.
+    """
+    path = os.environ.get("ELECTIVE_TRACE", None)
+
+    if not path:
+        return _NULL_TRACER
+
+    return Tracer(sinks=[ChromeTraceSink.shared(path)])
@@ -18,7 +18,9 @@ import bespon
 import toml
 from ruamel.yaml import YAML, YAMLError
 
-from .exceptions import ElectiveFileDecodingError
+from .exceptions import ElectiveFileDecodingError, ElectivePathConflictError
+
+_MISSING = object()
 
 
 def _is_listdict(d):
@@ -68,6 +70,62 @@ def _flatten_to_list(ds):
     return ds
 
 
+def _build_tree(pairs):
+    """Build a nested dict from key path and value pairs.
+
+    Insert each value at its key path in a single pass, creating
+    intermediate dicts as needed.  Lists are not reconstructed here;
+    pass the result through ``_flatten_to_list()`` for list-style
+    dicts.
+
+    Parameters
+    ----------
+    pairs : iterable
+        An iterable of ``(path, value)`` pairs, where ``path`` is a
+        non-empty sequence of keys from the root to the value.
+
+    Returns
+    -------
+    dict
+        The nested dict containing every value at its key path.
+
+    Raises
+    ------
+    ElectivePathConflictError
+        Raises when a path is defined more than once or is both a
+        value and the parent of other values.
+
+    """
+    tree = {}
+
+    for path, value in pairs:
+        node = tree
+        last = len(path) - 1
+
+        for depth, key in enumerate(path):
+            child = node.get(key, _MISSING)
+
+            if depth == last:
+                if child is not _MISSING:
+                    raise ElectivePathConflictError(
+                        message=f"{tuple(path)!r} is defined multiple times.",
+                        path=tuple(path),
+                    )
+                node[key] = value
+            elif child is _MISSING:
+                child = node[key] = {}
+                node = child
+            elif isinstance(child, dict):
+                node = child
+            else:
+                raise ElectivePathConflictError(
+                    message=f"{tuple(path[: depth + 1])!r} is defined multiple times.",
+                    path=tuple(path[: depth + 1]),
+                )
+
+    return tree
+
+
 def _format_sh(k, v, prefix):
     """Format a configuration value as a Bourne shell environment variable."""
     return f"export {prefix!s}{k!s}='{v!s}'"